@@ -1,66 +1,177 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 from storage.models import JobPost
 from storage.db import mark_applied
 from config import cfg
 from utils.logger import get_logger
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeoutError
 
 logger = get_logger("apply")
 
-def apply_linkedin_easy_apply(job: JobPost, resume_path: str, cover_letter_path: str) -> bool:
-    if not cfg.apply_linkedin_easy_apply:
-        return False
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(storage_state="output/linkedin_state.json")
-        page = context.new_page()
-        page.goto(job.url, timeout=60000)
-        page.wait_for_timeout(2000)
+# Fail fast on dead pages so one bad URL cannot stall a whole batch
+DEFAULT_TIMEOUT_MS = 5000
+NAVIGATION_TIMEOUT_MS = 15000
+OPTIONAL_FIELD_TIMEOUT_MS = 1000
+SETTLE_TIMEOUT_MS = 5000
+
+# Easy Apply flow
+DIALOG_TIMEOUT_MS = 10000
+STEP_PROBE_TIMEOUT_MS = 500
+CONFIRMATION_TIMEOUT_MS = 10000
+MAX_EASY_APPLY_STEPS = 6
+
+@dataclass(frozen=True)
+class EasyApplyLocators:
+    """Locators for each Easy Apply step.
+
+    Building a locator does no I/O, so they are built once per page up front.
+    """
+    apply_button: Any
+    dialog: Any
+    resume_input: Any
+    cover_letter: Any
+    submit: Any
+    next: Any
+    step_button: Any
+    confirmation: Any
+
+def easy_apply_locators(page) -> EasyApplyLocators:
+    submit = page.get_by_role("button", name="Submit application")
+    next_btn = page.get_by_role("button", name="Next").first
+    return EasyApplyLocators(
+        apply_button=page.get_by_role("button", name="Easy Apply"),
+        dialog=page.get_by_role("dialog"),
+        resume_input=page.locator("input[type='file']").first,
+        cover_letter=page.locator("textarea").first,
+        submit=submit,
+        next=next_btn,
+        # Whichever of Submit / Next the current step shows
+        step_button=submit.or_(next_btn).first,
+        confirmation=page.get_by_text("Application sent"),
+    )
+
+def _settle(page, timeout: int = SETTLE_TIMEOUT_MS) -> None:
+    # Let in-flight requests finish before reading the DOM; LinkedIn keeps
+    # long-polling connections open, so never block on networkidle for long.
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+class LinkedInApplySession:
+    """Keeps one Playwright browser/context alive across Easy Apply jobs.
+
+    The browser is launched lazily on the first application, and each job
+    gets its own page so only the page is torn down between jobs.
+    """
+
+    def __init__(self, storage_state: str = "output/linkedin_state.json", headless: bool = True):
+        self.storage_state = storage_state
+        self.headless = headless
+        self._playwright = None
+        self.browser = None
+        self.context = None
+
+    def start(self) -> "LinkedInApplySession":
+        if self.context is None:
+            self._playwright = sync_playwright().start()
+            self.browser = self._playwright.chromium.launch(headless=self.headless)
+            self.context = self.browser.new_context(storage_state=self.storage_state)
+            self.context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+            self.context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+        return self
+
+    def close(self) -> None:
+        if self.context is not None:
+            self.context.close()
+            self.context = None
+        if self.browser is not None:
+            self.browser.close()
+            self.browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def __enter__(self) -> "LinkedInApplySession":
+        # Defer the browser launch until a job actually needs it
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def apply_easy_apply(self, job: JobPost, resume_path: str, cover_letter_text: str) -> bool:
+        if not cfg.apply_linkedin_easy_apply:
+            return False
+        self.start()
+        page = self.context.new_page()
+        try:
+            return self._easy_apply(page, job, resume_path, cover_letter_text)
+        except PlaywrightTimeoutError as e:
+            logger.warning(f"Timed out applying to {job.url}: {e}")
+            return False
+        finally:
+            page.close()
+
+    def _easy_apply(self, page, job: JobPost, resume_path: str, cover_letter_text: str) -> bool:
+        steps = easy_apply_locators(page)
+        page.goto(job.url, wait_until="domcontentloaded")
+        _settle(page)
         # click Easy Apply
-        if page.get_by_role("button", name="Easy Apply").count() == 0:
+        if steps.apply_button.count() == 0:
             logger.info("No Easy Apply button.")
-            context.close()
-            browser.close()
             return False
-        page.get_by_role("button", name="Easy Apply").first.click()
-        page.wait_for_timeout(1500)
+        steps.apply_button.first.click()
+        try:
+            steps.dialog.wait_for(state="visible", timeout=DIALOG_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            logger.info("Easy Apply dialog did not open.")
+            return False
+        _settle(page)
 
-        # Upload resume if prompt exists
-        if page.locator("input[type='file']").count():
-            try:
-                file_input = page.locator("input[type='file']").first
-                file_input.set_input_files(resume_path)
-            except Exception:
-                pass
+        # Upload resume / fill cover letter if the step asks for them; a short
+        # timeout stands in for a separate count() probe on optional fields
+        try:
+            steps.resume_input.set_input_files(resume_path, timeout=OPTIONAL_FIELD_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
+        try:
+            steps.cover_letter.fill(cover_letter_text, timeout=OPTIONAL_FIELD_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
 
-        # fill cover letter if textarea exists
-        if page.locator("textarea").count():
+        # Iterate through modal steps (Next/Review/Submit)
+        for _ in range(MAX_EASY_APPLY_STEPS):
+            try:
+                expect(steps.step_button).to_be_visible()
+            except AssertionError:
+                break
             try:
-                page.locator("textarea").first.fill(open_text(cover_letter_path))
-            except Exception:
-                pass
+                steps.submit.wait_for(state="visible", timeout=STEP_PROBE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                steps.next.click()
+                _settle(page)
+                continue
+            steps.submit.click()
+            try:
+                steps.confirmation.wait_for(state="visible", timeout=CONFIRMATION_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                logger.warning("No submission confirmation seen; assuming sent.")
+            logger.info("LinkedIn application submitted.")
+            return True
 
-        # Iterate through modal steps (Next/Review/Submit)
-        for _ in range(6):
-            if page.get_by_role("button", name="Submit application").count():
-                page.get_by_role("button", name="Submit application").click()
-                page.wait_for_timeout(2000)
-                logger.info("LinkedIn application submitted.")
-                context.close()
-                browser.close()
-                return True
-            btn = page.get_by_role("button", name="Next").first if page.get_by_role("button", name="Next").count() else None
-            if btn:
-                btn.click()
-            page.wait_for_timeout(1500)
-
-        context.close()
-        browser.close()
         return False
 
+@lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime: float) -> str:
+    # mtime is part of the cache key so a regenerated file is re-read
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
 def open_text(path: str) -> str:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        return _read_text_cached(path, os.path.getmtime(path))
     except Exception:
         return ""
 
@@ -70,9 +181,19 @@ def apply_internshala(job: JobPost, resume_path: str, cover_letter_path: str) ->
     # Here we just open and return False to avoid TOS issues by default.
     return False
 
-def apply(job: JobPost, resume_path: str, cover_letter_path: str) -> bool:
+def apply(
+    job: JobPost,
+    resume_path: str,
+    cover_letter_path: str,
+    session: LinkedInApplySession | None = None,
+) -> bool:
     if job.source == "linkedin":
-        ok = apply_linkedin_easy_apply(job, resume_path, cover_letter_path)
+        cover_letter_text = open_text(cover_letter_path) if cover_letter_path else ""
+        if session is not None:
+            ok = session.apply_easy_apply(job, resume_path, cover_letter_text)
+        else:
+            with LinkedInApplySession() as one_off:
+                ok = one_off.apply_easy_apply(job, resume_path, cover_letter_text)
     elif job.source == "internshala" and cfg.apply_internshala:
         ok = apply_internshala(job, resume_path, cover_letter_path)
     else:
@@ -1,41 +1,127 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, BeforeValidator, ConfigDict, field_validator
 import os
+from functools import lru_cache
+from typing import Annotated, Mapping
 from dotenv import load_dotenv
 
-load_dotenv()
+_ROOT = os.path.join(os.path.dirname(__file__), '..')
+_dotenv_loaded = False
+
+def _load_dotenv_once() -> None:
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+def _path(env: Mapping[str, str], key: str, default: str) -> str:
+    return os.path.abspath(os.path.join(_ROOT, env.get(key, default)))
+
+def _parse_bool(value):
+    return value.lower() == "true" if isinstance(value, str) else value
+
+EnvBool = Annotated[bool, BeforeValidator(_parse_bool)]
 
 class Config(BaseModel):
-    llm_mode: str = os.getenv("LLM_MODE", "local")
-    llama_model_path: str = os.getenv("LLAMA_MODEL_PATH", "./models/mistral-7b-instruct-v0.2.Q4_K_M.gguf")
-    llama_ctx: int = int(os.getenv("LLAMA_CTX", "4096"))
-    llama_n_threads: int = int(os.getenv("LLAMA_N_THREADS", "6"))
-    llama_n_gpu_layers: int = int(os.getenv("LLAMA_N_GPU_LAYERS", "20"))
-
-    openai_api_key: str | None = os.getenv("OPENAI_API_KEY") or None
-    openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-    resume_path: str = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', os.getenv("RESUME_PATH", "./data/resume.docx")))
-    resume_template_path: str = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', os.getenv("RESUME_TEMPLATE_PATH", "./data/resume.docx")))
-    cover_letter_base_path: str = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', os.getenv("COVER_LETTER_BASE_PATH", "./data/cover_letter_base.docx")))
-
-    countries: list[str] = [c.strip() for c in os.getenv("COUNTRIES", "India").split(",") if c.strip()]
-    cities: list[str] = [c.strip() for c in os.getenv("CITIES", "").split(",") if c.strip()]
-    remote_ok: bool = os.getenv("REMOTE_OK", "true").lower() == "true"
-    remote_global_ok: bool = os.getenv("REMOTE_GLOBAL_OK", "true").lower() == "true"
-    keywords: list[str] = [k.strip() for k in os.getenv("KEYWORDS", "machine learning,ml engineer").split(",") if k.strip()]
-
-    enable_linkedin: bool = os.getenv("ENABLE_LINKEDIN", "true").lower() == "true"
-    enable_indeed: bool = os.getenv("ENABLE_INDEED", "true").lower() == "true"
-    enable_wellfound: bool = os.getenv("ENABLE_WELLFOUND", "true").lower() == "true"
-    enable_internshala: bool = os.getenv("ENABLE_INTERNSHALA", "true").lower() == "true"
-
-    apply_linkedin_easy_apply: bool = os.getenv("APPLY_LINKEDIN_EASY_APPLY", "true").lower() == "true"
-    apply_internshala: bool = os.getenv("APPLY_INTERNSHALA", "true").lower() == "true"
-    apply_wellfound: bool = os.getenv("APPLY_WELLFOUND", "true").lower() == "true"
-    apply_indeed: bool = os.getenv("APPLY_INDEED", "false").lower() == "true"
-    enable_tailoring: bool = os.getenv("ENABLE_TAILORING", "true").lower() == "true"
-
-    requests_per_min: int = int(os.getenv("REQUESTS_PER_MIN", "16"))
-    db_path: str = os.getenv("DB_PATH", "./agent.db")
-
-cfg = Config()
+    model_config = ConfigDict(frozen=True)
+
+    llm_mode: str
+    llama_model_path: str
+    tailor_model_path: str
+    llama_ctx: int
+    llama_n_threads: int
+    llama_n_gpu_layers: int
+
+    openai_api_key: str | None
+    openai_model: str
+
+    resume_path: str
+    resume_template_path: str
+    cover_letter_base_path: str
+
+    countries: tuple[str, ...]
+    cities: tuple[str, ...]
+    remote_ok: EnvBool
+    remote_global_ok: EnvBool
+    keywords: tuple[str, ...]
+
+    enable_linkedin: EnvBool
+    enable_indeed: EnvBool
+    enable_wellfound: EnvBool
+    enable_internshala: EnvBool
+
+    apply_linkedin_easy_apply: EnvBool
+    apply_internshala: EnvBool
+    apply_wellfound: EnvBool
+    apply_indeed: EnvBool
+    enable_tailoring: EnvBool
+    enable_llm_cache: EnvBool
+    llm_cache_similarity: float | None
+    llm_prompt_cache: str
+    tailor_max_tokens: int
+
+    requests_per_min: int
+    db_path: str
+
+    @field_validator("countries", "cities", "keywords", mode="before")
+    @classmethod
+    def _split_csv(cls, value):
+        if isinstance(value, str):
+            return [v.strip() for v in value.split(",") if v.strip()]
+        return value
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "Config":
+        """Build a Config from a snapshot of environment variables."""
+        llama_model_path = env.get("LLAMA_MODEL_PATH", "./models/mistral-7b-instruct-v0.2.Q4_K_M.gguf")
+        return cls(
+            llm_mode=env.get("LLM_MODE", "local"),
+            llama_model_path=llama_model_path,
+            tailor_model_path=env.get("RESUME_TAILOR_MODEL") or llama_model_path,
+            llama_ctx=env.get("LLAMA_CTX", "4096"),
+            llama_n_threads=env.get("LLAMA_N_THREADS", "6"),
+            llama_n_gpu_layers=env.get("LLAMA_N_GPU_LAYERS", "20"),
+
+            openai_api_key=env.get("OPENAI_API_KEY") or None,
+            openai_model=env.get("OPENAI_MODEL", "gpt-4o-mini"),
+
+            resume_path=_path(env, "RESUME_PATH", "./data/resume.docx"),
+            resume_template_path=_path(env, "RESUME_TEMPLATE_PATH", "./data/resume.docx"),
+            cover_letter_base_path=_path(env, "COVER_LETTER_BASE_PATH", "./data/cover_letter_base.docx"),
+
+            countries=env.get("COUNTRIES", "India"),
+            cities=env.get("CITIES", ""),
+            remote_ok=env.get("REMOTE_OK", "true"),
+            remote_global_ok=env.get("REMOTE_GLOBAL_OK", "true"),
+            keywords=env.get("KEYWORDS", "machine learning,ml engineer"),
+
+            enable_linkedin=env.get("ENABLE_LINKEDIN", "true"),
+            enable_indeed=env.get("ENABLE_INDEED", "true"),
+            enable_wellfound=env.get("ENABLE_WELLFOUND", "true"),
+            enable_internshala=env.get("ENABLE_INTERNSHALA", "true"),
+
+            apply_linkedin_easy_apply=env.get("APPLY_LINKEDIN_EASY_APPLY", "true"),
+            apply_internshala=env.get("APPLY_INTERNSHALA", "true"),
+            apply_wellfound=env.get("APPLY_WELLFOUND", "true"),
+            apply_indeed=env.get("APPLY_INDEED", "false"),
+            enable_tailoring=env.get("ENABLE_TAILORING", "true"),
+            enable_llm_cache=env.get("LLM_CACHE", "true"),
+            llm_cache_similarity=env.get("LLM_CACHE_SIMILARITY") or None,
+            llm_prompt_cache=env.get("LLM_PROMPT_CACHE", "off").lower(),
+            tailor_max_tokens=env.get("TAILOR_MAX_TOKENS", "2048"),
+
+            requests_per_min=env.get("REQUESTS_PER_MIN", "16"),
+            db_path=env.get("DB_PATH", "./agent.db"),
+        )
+
+@lru_cache(maxsize=1)
+def get_cfg() -> Config:
+    """Load .env (once per process) and return the cached Config.
+
+    Settings are read once per process: modules import the module-level
+    ``cfg`` below, and .env is not re-read, so restart to apply changes.
+    To build a Config from other values, use ``Config.from_env``.
+    """
+    _load_dotenv_once()
+    return Config.from_env(dict(os.environ))
+
+cfg = get_cfg()
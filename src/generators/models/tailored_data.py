@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Defer core-schema construction until a model is first used, so importing
+# this module stays cheap for callers that never touch tailoring
+_DEFERRED = ConfigDict(defer_build=True, extra="ignore")
 
 class ExperienceEntry(BaseModel):
     """Structured data for a single work experience entry."""
@@ -14,13 +18,18 @@ class ExperienceEntry(BaseModel):
     bullets: List[str] = Field(default_factory=list)
     is_current: bool = False
     
-    class Config:
-        json_encoders = {
+    model_config = ConfigDict(
+        defer_build=True,
+        extra="ignore",
+        json_encoders={
             datetime: lambda v: v.isoformat() if v else None
         }
+    )
 
 class ProjectEntry(BaseModel):
     """Structured data for a single project entry."""
+    model_config = _DEFERRED
+    
     name: str = ""
     description: str = ""
     technologies: List[str] = Field(default_factory=list)
@@ -31,6 +40,8 @@ class ProjectEntry(BaseModel):
 
 class EducationEntry(BaseModel):
     """Structured data for an education entry."""
+    model_config = _DEFERRED
+    
     degree: str = ""
     field_of_study: str = ""
     institution: str = ""
@@ -43,6 +54,8 @@ class EducationEntry(BaseModel):
 
 class PublicationEntry(BaseModel):
     """Structured data for a research publication."""
+    model_config = _DEFERRED
+    
     title: str = ""
     authors: List[str] = Field(default_factory=list)
     publication: str = ""  # Journal/Conference name
@@ -52,10 +65,18 @@ class PublicationEntry(BaseModel):
 
 class SkillCategory(BaseModel):
     """Structured data for a skill category."""
+    model_config = _DEFERRED
+    
     name: str
     skills: List[str] = Field(default_factory=list)
     proficiency: Optional[str] = None  # e.g., "Advanced", "Intermediate"
 
+# Module-level adapters let pydantic-core (de)serialize whole lists at once
+_EXPERIENCE_ADAPTER = TypeAdapter(List[ExperienceEntry], config=_DEFERRED)
+_PROJECT_ADAPTER = TypeAdapter(List[ProjectEntry], config=_DEFERRED)
+_EDUCATION_ADAPTER = TypeAdapter(List[EducationEntry], config=_DEFERRED)
+_PUBLICATION_ADAPTER = TypeAdapter(List[PublicationEntry], config=_DEFERRED)
+
 @dataclass
 class TailoredResumeData:
     """Structured data container for tailored resume content with validation."""
@@ -69,36 +90,42 @@ class TailoredResumeData:
     
     def is_empty(self) -> bool:
         """Check if the tailored data container is empty."""
-        return not any([
+        # Generator (not a list) so any() stops testing at the first populated field;
+        # summary is checked first as it is the field most often present
+        return not any(field_value for field_value in (
             self.summary,
             self.experience,
             self.projects,
             self.technical_skills,
             self.education,
             self.research_publications
-        ])
+        ))
     
     def to_dict(self) -> dict:
         """Convert the resume data to a dictionary."""
+        # The LLM parsers may store plain dicts/strings; those are passed
+        # through unchanged, so silence pydantic's type-mismatch warnings.
         return {
             "summary": self.summary,
-            "experience": [exp.dict() for exp in self.experience],
-            "projects": [proj.dict() for proj in self.projects],
+            "experience": _EXPERIENCE_ADAPTER.dump_python(self.experience, warnings=False),
+            "projects": _PROJECT_ADAPTER.dump_python(self.projects, warnings=False),
             "technical_skills": self.technical_skills,
-            "education": [edu.dict() for edu in self.education],
-            "research_publications": [pub.dict() for pub in self.research_publications]
+            "education": _EDUCATION_ADAPTER.dump_python(self.education, warnings=False),
+            "research_publications": _PUBLICATION_ADAPTER.dump_python(
+                self.research_publications, warnings=False
+            )
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'TailoredResumeData':
         """Create a TailoredResumeData instance from a dictionary."""
-        resume = cls()
-        resume.summary = data.get("summary", "")
-        resume.experience = [ExperienceEntry(**exp) for exp in data.get("experience", [])]
-        resume.projects = [ProjectEntry(**proj) for proj in data.get("projects", [])]
-        resume.technical_skills = data.get("technical_skills", {})
-        resume.education = [EducationEntry(**edu) for edu in data.get("education", [])]
-        resume.research_publications = [
-            PublicationEntry(**pub) for pub in data.get("research_publications", [])
-        ]
-        return resume
+        return cls(
+            summary=data.get("summary", ""),
+            experience=_EXPERIENCE_ADAPTER.validate_python(data.get("experience", [])),
+            projects=_PROJECT_ADAPTER.validate_python(data.get("projects", [])),
+            technical_skills=data.get("technical_skills", {}),
+            education=_EDUCATION_ADAPTER.validate_python(data.get("education", [])),
+            research_publications=_PUBLICATION_ADAPTER.validate_python(
+                data.get("research_publications", [])
+            )
+        )
@@ -1,19 +1,58 @@
 import logging
 from datetime import datetime
+from string import Template
 from typing import Optional, List
 from docx import Document
 
 from ..utils.docx_utils import (
-    add_paragraph_with_style
+    bulk_add_paragraphs
 )
 from ..utils.template_utils import (
     get_template_path,
+    collect_contact_info,
+    snapshot_attrs,
     create_document,
     save_document
 )
 
 logger = logging.getLogger("tailor")
 
+_JOB_FIELDS = ('title', 'company', 'location', 'hiring_manager', 'requirements', 'company_description')
+_PROFILE_FIELDS = ('name', 'email', 'phone', 'linkedin', 'current_role', 'experience', 'skills')
+
+# Letter scaffolding, compiled once and filled in per job
+_INTRO_TMPL = Template("I am excited to apply for the $position position at $company. ")
+_INTRO_ROLE_TMPL = Template(
+    "With my experience as a $role, "
+    "I am confident in my ability to contribute effectively to your team. "
+)
+_INTRO_FALLBACK = "I am confident that my skills and experience make me a strong candidate. "
+
+_EXPERIENCE_TMPL = Template(
+    "In my current role, I have $summaries. "
+    "This experience has equipped me with valuable skills that align well with the requirements for this position."
+)
+_SKILLS_TMPL = Template("My technical expertise includes $skills, and $last_skill. ")
+_SKILLS_REQUIREMENTS = (
+    "I am particularly drawn to this opportunity because my background in these areas "
+    "directly aligns with the key requirements you're seeking. "
+)
+_SKILLS_CLOSER = "I am eager to bring my skills and experience to your team and contribute to your company's success."
+_INTEREST_LEAD = "I am particularly interested in this opportunity because "
+_INTEREST_COMPANY_TMPL = Template(
+    "I admire $company's $focus and I am excited about the prospect of contributing to your team. "
+)
+_INTEREST_DEFAULT_FOCUS = "work in the industry"
+_INTEREST_CLOSER = "I am confident that my background and skills would make me a valuable addition to your organization."
+
+_CLOSING_LEAD = (
+    "Thank you for considering my application. "
+    "I would welcome the opportunity to discuss how my skills and experience align with your needs. "
+    "I am available at your earliest convenience for an interview and can be reached at "
+)
+_CLOSING_PHONE_TMPL = Template("$phone or ")
+_CLOSING_TAIL_TMPL = Template("$email. I look forward to the possibility of contributing to your team.")
+
 class CoverLetterService:
     """Handles cover letter generation and customization."""
     
@@ -21,6 +60,9 @@ class CoverLetterService:
         """Initialize with profile and job data."""
         self.profile = profile
         self.job = job
+        # Snapshot the fields used by the letter so each is looked up once
+        self._job_view = snapshot_attrs(job, _JOB_FIELDS)
+        self._profile_view = snapshot_attrs(profile, _PROFILE_FIELDS)
     
     def generate_cover_letter(
         self,
@@ -48,124 +90,96 @@ class CoverLetterService:
     
     def _add_cover_letter_content(self, doc: Document) -> None:
         """Add content to the cover letter document."""
+        # Collect every line first, then write them to the document in one pass
+        lines: List[str] = []
+        
         # Add date
-        today = datetime.now().strftime("%B %d, %Y")
-        add_paragraph_with_style(doc, today, style_name='Normal')
+        lines.append(datetime.now().strftime("%B %d, %Y"))
         
         # Add recipient info
-        if hasattr(self.job, 'company') and self.job.company:
-            add_paragraph_with_style(doc, self.job.company, style_name='Normal')
-            add_paragraph_with_style(doc, "Hiring Manager", style_name='Normal')
-            add_paragraph_with_style(doc, self.job.company, style_name='Normal')
-            if hasattr(self.job, 'location') and self.job.location:
-                add_paragraph_with_style(doc, self.job.location, style_name='Normal')
+        job = self._job_view
+        company = job.company
+        if company:
+            lines.extend((company, "Hiring Manager", company))
+            if job.location:
+                lines.append(job.location)
         
         # Add salutation
         salutation = "Dear Hiring Manager,"
-        if hasattr(self.job, 'hiring_manager') and self.job.hiring_manager:
-            salutation = f"Dear {self.job.hiring_manager},"
-        add_paragraph_with_style(doc, salutation, style_name='Normal')
-        add_paragraph_with_style(doc, "", style_name='Normal')  # Empty line
+        if job.hiring_manager:
+            salutation = f"Dear {job.hiring_manager},"
+        lines.append(salutation)
+        lines.append("")  # Empty line
         
-        # Add introduction
-        intro = self._generate_introduction()
-        add_paragraph_with_style(doc, intro, style_name='Normal')
-        
-        # Add body paragraphs
-        body_paragraphs = self._generate_body_paragraphs()
-        for para in body_paragraphs:
-            add_paragraph_with_style(doc, para, style_name='Normal')
+        # Add introduction and body paragraphs
+        lines.append(self._generate_introduction())
+        lines.extend(self._generate_body_paragraphs())
         
         # Add closing
-        closing = self._generate_closing()
-        add_paragraph_with_style(doc, closing, style_name='Normal')
-        add_paragraph_with_style(doc, "Sincerely,", style_name='Normal')
+        lines.append(self._generate_closing())
+        lines.append("Sincerely,")
         
         # Add signature
-        if hasattr(self.profile, 'name') and self.profile.name:
-            add_paragraph_with_style(doc, self.profile.name, style_name='Normal')
+        profile = self._profile_view
+        if profile.name:
+            lines.append(profile.name)
             
             # Add contact info if available
-            contact_info = []
-            if hasattr(self.profile, 'email') and self.profile.email:
-                contact_info.append(self.profile.email)
-            if hasattr(self.profile, 'phone') and self.profile.phone:
-                contact_info.append(self.profile.phone)
-            if hasattr(self.profile, 'linkedin') and self.profile.linkedin:
-                contact_info.append(self.profile.linkedin)
-            
+            contact_info = collect_contact_info(profile, ('email', 'phone', 'linkedin'))
             if contact_info:
-                add_paragraph_with_style(doc, "  ".join(contact_info), style_name='Normal')
+                lines.append("  ".join(contact_info))
+        
+        bulk_add_paragraphs(doc, [(line, 'Normal') for line in lines])
     
     def _generate_introduction(self) -> str:
         """Generate the introduction paragraph of the cover letter."""
-        position = getattr(self.job, 'title', 'this position')
-        company = getattr(self.job, 'company', 'your company')
-        
-        intro = f"I am excited to apply for the {position} position at {company}. "
-        
-        if hasattr(self.profile, 'current_role') and self.profile.current_role:
-            intro += f"With my experience as a {self.profile.current_role}, "
-            intro += "I am confident in my ability to contribute effectively to your team. "
-        else:
-            intro += "I am confident that my skills and experience make me a strong candidate. "
-        
-        return intro
+        intro = _INTRO_TMPL.substitute(
+            position=self._job_view.title or 'this position',
+            company=self._job_view.company or 'your company'
+        )
+        current_role = self._profile_view.current_role
+        if current_role:
+            return intro + _INTRO_ROLE_TMPL.substitute(role=current_role)
+        return intro + _INTRO_FALLBACK
     
     def _generate_body_paragraphs(self) -> List[str]:
         """Generate the body paragraphs of the cover letter."""
         paragraphs = []
+        job = self._job_view
+        profile = self._profile_view
         
         # First paragraph - relevant experience
-        exp_para = ""
-        if hasattr(self.profile, 'experience') and self.profile.experience:
-            exp_para = "In my current role, I have "
-            exp_para += ", ".join([exp.get('summary', '') for exp in self.profile.experience[:2]])
-            exp_para += ". This experience has equipped me with valuable skills that align well with the requirements for this position."
-        
-        if exp_para:
-            paragraphs.append(exp_para)
+        experience = profile.experience
+        if experience:
+            paragraphs.append(_EXPERIENCE_TMPL.substitute(
+                summaries=", ".join([exp.get('summary', '') for exp in experience[:2]])
+            ))
         
         # Second paragraph - relevant skills
-        skills_para = ""
-        if hasattr(self.profile, 'skills') and self.profile.skills:
-            skills = self.profile.skills[:5]  # Take top 5 skills
-            skills_para = f"My technical expertise includes {', '.join(skills[:-1])}, and {skills[-1]}. "
-            
-            if hasattr(self.job, 'requirements') and self.job.requirements:
-                skills_para += "I am particularly drawn to this opportunity because my background in these areas directly aligns with the key requirements you're seeking. "
-            
-            skills_para += "I am eager to bring my skills and experience to your team and contribute to your company's success."
-        
-        if skills_para:
-            paragraphs.append(skills_para)
+        skills = profile.skills
+        if skills:
+            skills = skills[:5]  # Take top 5 skills
+            parts = [_SKILLS_TMPL.substitute(skills=', '.join(skills[:-1]), last_skill=skills[-1])]
+            if job.requirements:
+                parts.append(_SKILLS_REQUIREMENTS)
+            parts.append(_SKILLS_CLOSER)
+            paragraphs.append("".join(parts))
         
         # Third paragraph - why you're interested
-        interest_para = "I am particularly interested in this opportunity because "
-        if hasattr(self.job, 'company') and self.job.company:
-            interest_para += f"I admire {self.job.company}'s "
-            if hasattr(self.job, 'company_description') and self.job.company_description:
-                interest_para += f"{self.job.company_description.lower()} "
-            else:
-                interest_para += "work in the industry "
-            
-            interest_para += "and I am excited about the prospect of contributing to your team. "
-        
-        interest_para += "I am confident that my background and skills would make me a valuable addition to your organization."
-        paragraphs.append(interest_para)
+        parts = [_INTEREST_LEAD]
+        if job.company:
+            focus = job.company_description.lower() if job.company_description else _INTEREST_DEFAULT_FOCUS
+            parts.append(_INTEREST_COMPANY_TMPL.substitute(company=job.company, focus=focus))
+        parts.append(_INTEREST_CLOSER)
+        paragraphs.append("".join(parts))
         
         return paragraphs
     
     def _generate_closing(self) -> str:
         """Generate the closing paragraph of the cover letter."""
-        closing = "Thank you for considering my application. "
-        closing += "I would welcome the opportunity to discuss how my skills and experience align with your needs. "
-        closing += "I am available at your earliest convenience for an interview and can be reached at "
-        
-        if hasattr(self.profile, 'phone') and self.profile.phone:
-            closing += f"{self.profile.phone} or "
-            
-        closing += f"{self.profile.email}. "
-        closing += "I look forward to the possibility of contributing to your team."
-        
-        return closing
+        profile = self._profile_view
+        parts = [_CLOSING_LEAD]
+        if profile.phone:
+            parts.append(_CLOSING_PHONE_TMPL.substitute(phone=profile.phone))
+        parts.append(_CLOSING_TAIL_TMPL.substitute(email=profile.email))
+        return "".join(parts)
@@ -9,12 +9,16 @@ from ..utils.docx_utils import (
     add_bullet_points
 )
 from ..utils.template_utils import (
+    collect_contact_info,
+    snapshot_attrs,
     create_document,
     save_document
 )
 
 logger = logging.getLogger("tailor")
 
+_PROFILE_FIELDS = ('name', 'email', 'phone', 'linkedin', 'location', 'summary', 'experience', 'skills', 'education')
+
 class FallbackService:
     """Handles fallback mechanisms when primary tailoring fails."""
     
@@ -22,6 +26,8 @@ class FallbackService:
         """Initialize with profile and job data."""
         self.profile = profile
         self.job = job
+        # Snapshot the profile fields used by the fallbacks so each is looked up once
+        self._profile_view = snapshot_attrs(profile, _PROFILE_FIELDS)
     
     def create_basic_resume(
         self,
@@ -46,41 +52,38 @@ class FallbackService:
     
     def _add_basic_resume_content(self, doc: Document) -> None:
         """Add basic resume content to the document."""
+        profile = self._profile_view
+        
         # Add name and contact info
-        if hasattr(self.profile, 'name') and self.profile.name:
-            add_paragraph_with_style(doc, self.profile.name, 'Heading 1')
+        name = profile.name
+        if name:
+            add_paragraph_with_style(doc, name, 'Heading 1')
             
             # Add contact information
-            contact_info = []
-            if hasattr(self.profile, 'email') and self.profile.email:
-                contact_info.append(self.profile.email)
-            if hasattr(self.profile, 'phone') and self.profile.phone:
-                contact_info.append(self.profile.phone)
-            if hasattr(self.profile, 'linkedin') and self.profile.linkedin:
-                contact_info.append(self.profile.linkedin)
-            if hasattr(self.profile, 'location') and self.profile.location:
-                contact_info.append(self.profile.location)
-                
+            contact_info = collect_contact_info(profile)
             if contact_info:
                 add_paragraph_with_style(doc, " | ".join(contact_info), 'Normal')
         
         # Add summary if available
-        if hasattr(self.profile, 'summary') and self.profile.summary:
+        summary = profile.summary
+        if summary:
             add_section(doc, "SUMMARY")
-            add_paragraph_with_style(doc, self.profile.summary, 'Normal')
+            add_paragraph_with_style(doc, summary, 'Normal')
         
         # Add experience
-        if hasattr(self.profile, 'experience') and self.profile.experience:
+        experience = profile.experience
+        if experience:
             add_section(doc, "EXPERIENCE")
-            for exp in self.profile.experience[:3]:  # Limit to 3 most recent
+            for exp in experience[:3]:  # Limit to 3 most recent
                 self._add_basic_experience_entry(doc, exp)
         
         # Add skills
-        if hasattr(self.profile, 'skills') and self.profile.skills:
+        profile_skills = profile.skills
+        if profile_skills:
             add_section(doc, "SKILLS")
             # Group skills if they're categorized
-            if isinstance(self.profile.skills, dict):
-                for category, skills in self.profile.skills.items():
+            if isinstance(profile_skills, dict):
+                for category, skills in profile_skills.items():
                     if skills:
                         add_paragraph_with_style(
                             doc,
@@ -91,14 +94,15 @@ class FallbackService:
                 # Just a flat list of skills
                 add_paragraph_with_style(
                     doc,
-                    ', '.join(self.profile.skills[:20]),  # Limit to top 20 skills
+                    ', '.join(profile_skills[:20]),  # Limit to top 20 skills
                     'Normal'
                 )
         
         # Add education
-        if hasattr(self.profile, 'education') and self.profile.education:
+        education = profile.education
+        if education:
             add_section(doc, "EDUCATION")
-            for edu in self.profile.education[:2]:  # Limit to 2 most recent
+            for edu in education[:2]:  # Limit to 2 most recent
                 self._add_basic_education_entry(doc, edu)
     
     def _add_basic_experience_entry(self, doc: Document, exp: Dict[str, Any]) -> None:
@@ -153,103 +157,109 @@ class FallbackService:
     
     def _create_simple_text_fallback(self, output_path: str) -> str:
         """Create a simple text file as a last resort fallback."""
+        temp_path = None
         try:
             # Ensure output directory exists
             output_dir = os.path.dirname(output_path)
             if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir, exist_ok=True, mode=0o755)
             
-            # Create a simple text version
-            text_content = []
+            profile = self._profile_view
             
-            # Add name and contact info
-            if hasattr(self.profile, 'name') and self.profile.name:
-                text_content.append(self.profile.name.upper())
-                text_content.append("=" * len(self.profile.name))
-                text_content.append("")
+            # Stream lines to a temp file instead of buffering the whole resume;
+            # it replaces output_path only once complete
+            temp_path = f"{output_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+                write = f.write
                 
-                # Add contact information
-                contact_info = []
-                if hasattr(self.profile, 'email') and self.profile.email:
-                    contact_info.append(f"Email: {self.profile.email}")
-                if hasattr(self.profile, 'phone') and self.profile.phone:
-                    contact_info.append(f"Phone: {self.profile.phone}")
-                if hasattr(self.profile, 'linkedin') and self.profile.linkedin:
-                    contact_info.append(f"LinkedIn: {self.profile.linkedin}")
-                if hasattr(self.profile, 'location') and self.profile.location:
-                    contact_info.append(f"Location: {self.profile.location}")
+                def line(text: str = "") -> None:
+                    write(text)
+                    write("\n")
                 
-                if contact_info:
-                    text_content.append(" | ".join(contact_info))
-                    text_content.append("")
-            
-            # Add summary
-            if hasattr(self.profile, 'summary') and self.profile.summary:
-                text_content.append("SUMMARY")
-                text_content.append("-" * 7)
-                text_content.append(self.profile.summary)
-                text_content.append("")
-            
-            # Add experience
-            if hasattr(self.profile, 'experience') and self.profile.experience:
-                text_content.append("EXPERIENCE")
-                text_content.append("-" * 10)
-                for exp in self.profile.experience[:3]:  # Limit to 3 most recent
-                    # Add job header
-                    header_parts = []
-                    if 'title' in exp and exp['title']:
-                        header_parts.append(exp['title'])
-                    if 'company' in exp and exp['company']:
-                        header_parts.append(exp['company'])
-                    if 'dates' in exp and exp['dates']:
-                        header_parts.append(exp['dates'])
-                    
-                    if header_parts:
-                        text_content.append(" | ".join(header_parts))
+                # Add name and contact info
+                name = profile.name
+                if name:
+                    line(name.upper())
+                    line("=" * len(name))
+                    line()
                     
-                    # Add bullet points
-                    if 'highlights' in exp and exp['highlights']:
-                        for point in exp['highlights'][:3]:  # Limit to 3 bullet points
-                            text_content.append(f"- {point}")
+                    # Add contact information
+                    contact_info = collect_contact_info(profile, labeled=True)
                     
-                    text_content.append("")  # Empty line between entries
-            
-            # Add skills
-            if hasattr(self.profile, 'skills') and self.profile.skills:
-                text_content.append("SKILLS")
-                text_content.append("-" * 6)
+                    if contact_info:
+                        line(" | ".join(contact_info))
+                        line()
                 
-                if isinstance(self.profile.skills, dict):
-                    for category, skills in self.profile.skills.items():
-                        if skills:
-                            text_content.append(f"{category}: {', '.join(skills[:10])}")
-                else:
-                    # Just a flat list of skills
-                    text_content.append(", ".join(self.profile.skills[:20]))  # Limit to top 20 skills
+                # Add summary
+                summary = profile.summary
+                if summary:
+                    line("SUMMARY")
+                    line("-" * 7)
+                    line(summary)
+                    line()
                 
-                text_content.append("")  # Empty line
-            
-            # Add education
-            if hasattr(self.profile, 'education') and self.profile.education:
-                text_content.append("EDUCATION")
-                text_content.append("-" * 9)
-                for edu in self.profile.education[:2]:  # Limit to 2 most recent
-                    edu_parts = []
-                    if 'degree' in edu and edu['degree']:
-                        edu_parts.append(edu['degree'])
-                    if 'institution' in edu and edu['institution']:
-                        edu_parts.append(f"at {edu['institution']}")
-                    if 'dates' in edu and edu['dates']:
-                        edu_parts.append(f"({edu['dates']})")
+                # Add experience
+                experience = profile.experience
+                if experience:
+                    line("EXPERIENCE")
+                    line("-" * 10)
+                    for exp in experience[:3]:  # Limit to 3 most recent
+                        # Add job header
+                        header_parts = []
+                        if 'title' in exp and exp['title']:
+                            header_parts.append(exp['title'])
+                        if 'company' in exp and exp['company']:
+                            header_parts.append(exp['company'])
+                        if 'dates' in exp and exp['dates']:
+                            header_parts.append(exp['dates'])
+                        
+                        if header_parts:
+                            line(" | ".join(header_parts))
+                        
+                        # Add bullet points
+                        if 'highlights' in exp and exp['highlights']:
+                            for point in exp['highlights'][:3]:  # Limit to 3 bullet points
+                                line(f"- {point}")
+                        
+                        line()  # Empty line between entries
+                
+                # Add skills
+                profile_skills = profile.skills
+                if profile_skills:
+                    line("SKILLS")
+                    line("-" * 6)
                     
-                    if edu_parts:
-                        text_content.append(" ".join(edu_parts))
+                    if isinstance(profile_skills, dict):
+                        for category, skills in profile_skills.items():
+                            if skills:
+                                line(f"{category}: {', '.join(skills[:10])}")
+                    else:
+                        # Just a flat list of skills
+                        line(", ".join(profile_skills[:20]))  # Limit to top 20 skills
+                    
+                    line()  # Empty line
                 
-                text_content.append("")  # Empty line
+                # Add education
+                education = profile.education
+                if education:
+                    line("EDUCATION")
+                    line("-" * 9)
+                    for edu in education[:2]:  # Limit to 2 most recent
+                        edu_parts = []
+                        if 'degree' in edu and edu['degree']:
+                            edu_parts.append(edu['degree'])
+                        if 'institution' in edu and edu['institution']:
+                            edu_parts.append(f"at {edu['institution']}")
+                        if 'dates' in edu and edu['dates']:
+                            edu_parts.append(f"({edu['dates']})")
+                        
+                        if edu_parts:
+                            line(" ".join(edu_parts))
+                    
+                    line()  # Empty line
             
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("\n".join(text_content))
+            os.replace(temp_path, output_path)
+            temp_path = None
             
             logger.info(f"Created simple text resume at {output_path}")
             return output_path
@@ -257,3 +267,10 @@ class FallbackService:
         except Exception as e:
             logger.error(f"Failed to create simple text fallback: {e}")
             raise
+        finally:
+            # Don't leave a half-written temp file behind; output_path is untouched
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
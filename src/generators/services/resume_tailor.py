@@ -1,25 +1,98 @@
 import os
 import logging
-from typing import Optional, Dict, List
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, Optional, Dict, List, Tuple
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml.ns import qn
+from docx.shared import Inches
+from docx.text.paragraph import Paragraph
 
-from ..models.tailored_data import TailoredResumeData
+from ..models.tailored_data import PublicationEntry, TailoredResumeData
 from ..utils.docx_utils import (
     add_paragraph_with_style,
-    add_section,
     add_bullet_points,
-    get_or_create_style
+    append_body_xml,
+    bulk_add_paragraphs,
+    ensure_list_numbering,
+    ensure_styles,
+    get_hanging_bullet_style,
+    last_paragraph,
+    xml_attr,
+    xml_run_content
 )
+from ..utils.parsing_utils import StreamingResponseParser, parse_llm_response, parse_llm_responses
 from ..utils.template_utils import (
     get_template_path,
     create_document,
     save_document
 )
+from config import cfg
 from llm import get_local_llm
-from llm.prompts import TAILOR_PROMPT
+from llm.cache import get_response_cache
+from llm.prompts import TAILOR_PROMPT_JOB_SUFFIX, TAILOR_PROMPT_PREFIX
 
 logger = logging.getLogger("tailor")
 
+# Precompiled lookups for the raw paragraph XML walked in _clear_until_next_heading
+_W_P = qn('w:p')
+_W_PPR = qn('w:pPr')
+_W_PSTYLE = qn('w:pStyle')
+_W_VAL = qn('w:val')
+# Heading texts a template may use for each section, matched case-insensitively
+_SECTION_HEADINGS = {
+    "SUMMARY": ("SUMMARY", "PROFESSIONAL SUMMARY"),
+    "EXPERIENCE": ("EXPERIENCE", "WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE"),
+    "PROJECTS": ("PROJECTS", "KEY PROJECTS", "PERSONAL PROJECTS", "SIDE PROJECTS"),
+    "SKILLS": ("SKILLS", "TECHNICAL SKILLS"),
+    "EDUCATION": ("EDUCATION", "EDUCATION AND CERTIFICATIONS"),
+    "RESEARCH PUBLICATIONS": ("RESEARCH PUBLICATIONS", "RESEARCH & PUBLICATIONS", "PUBLICATIONS", "RESEARCH"),
+}
+# Lower-cased w:pStyle ids of top-level section headings; Heading 2+ are
+# entry titles inside a section (job titles, project names)
+_SECTION_STYLE_IDS = frozenset({'heading1', 'title'})
+
+def create_docx_pool() -> ProcessPoolExecutor:
+    """Create a process pool for building resume documents.
+    
+    The caller owns the pool and must shut it down, e.g. with a ``with`` block.
+    """
+    # spawn rather than fork: the parent holds the loaded model and its threads
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+def _build_resume_document(profile, job, tailored_data: TailoredResumeData, output_path: str) -> Optional[str]:
+    """Process-pool worker: build and save one tailored resume, or return None on failure."""
+    try:
+        return ResumeTailor(profile, job).create_tailored_resume(tailored_data, output_path)
+    except Exception as e:
+        logger.error(f"Resume build failed for {getattr(job, 'job_id', job)}: {e}")
+        return None
+
+def _publication_text(pub) -> str:
+    """One line per publication: JSON responses give strings, the regex fallback PublicationEntry."""
+    if isinstance(pub, PublicationEntry):
+        return ', '.join(part for part in (pub.title, pub.publication, pub.date) if part)
+    return str(pub).strip()
+
+def _job_format_kwargs(job) -> Dict[str, str]:
+    """Fields of a JobPost keyed by their TAILOR_PROMPT_JOB_SUFFIX placeholders."""
+    return {
+        'job_title': job.title or '',
+        'company': job.company or '',
+        'location': job.location or '',
+        'job_url': job.url or '',
+        'job_text': job.description or '',
+    }
+
+def _cache_match_kwargs(job) -> Dict[str, str]:
+    """Fields a near-duplicate response cache hit must match exactly."""
+    return {'company': job.company or '', 'title': job.title or ''}
+
 class ResumeTailor:
     """Handles the core resume tailoring functionality."""
     
@@ -27,45 +100,169 @@ class ResumeTailor:
         """Initialize with profile and job data."""
         self.profile = profile
         self.job = job
-        
+        # Heading text -> paragraph, valid while a template is being updated
+        self._heading_index: Optional[Dict[str, object]] = None
+        # Resume-bound prompt prefix, formatted on first use
+        self._prompt_prefix: Optional[str] = None
+    
+    @classmethod
+    def preload(cls) -> None:
+        """Load the LLM up front so the first tailoring call skips the cold start."""
+        get_local_llm(cfg.tailor_model_path)
+        
+    def _get_prompt_prefix(self) -> str:
+        """Format the resume part of the prompt; it is the same for every job, so once."""
+        if self._prompt_prefix is None:
+            self._prompt_prefix = TAILOR_PROMPT_PREFIX.format(
+                resume_text=getattr(self.profile, 'raw_text', '')
+            )
+        return self._prompt_prefix
+    
+    def _build_job_suffix(self, job) -> str:
+        return TAILOR_PROMPT_JOB_SUFFIX.format_map(_job_format_kwargs(job))
+    
     def generate_tailored_content(self) -> TailoredResumeData:
         """Generate tailored resume content using LLM."""
-        # Format the prompt with job and resume data
-        prompt = TAILOR_PROMPT.format(
-            job_title=getattr(self.job, 'title', ''),
-            company=getattr(self.job, 'company', ''),
-            location=getattr(self.job, 'location', ''),
-            job_url=getattr(self.job, 'url', ''),
-            resume_text=getattr(self.profile, 'raw_text', ''),
-            job_text=getattr(self.job, 'description', '')
-        )
-        
-        # Get LLM response
-        llm = get_local_llm()
-        response = llm.generate(prompt)
-        
-        # Parse the response into TailoredResumeData
-        return self._parse_llm_response(response)
+        return self.generate_tailored_content_batch([self.job])[0]
     
-    def _parse_llm_response(self, response: str) -> TailoredResumeData:
-        """Parse LLM response into structured TailoredResumeData."""
-        from ..utils.parsing_utils import (
-            _parse_summary, _parse_experience, _parse_projects,
-            _parse_skills, _parse_education, _parse_research_publications
-        )
+    def generate_tailored_content_batch(self, jobs: List) -> List[Optional[TailoredResumeData]]:
+        """Tailor this profile against several jobs.
         
-        tailored = TailoredResumeData()
+        Responses for job postings seen before are served from the response
+        cache; only the misses go to the LLM. Misses are
+        streamed, so parsing overlaps with decoding and generation stops as
+        soon as the JSON object is complete.
         
-        # Parse each section
-        _parse_summary(response, tailored)
-        _parse_experience(response, tailored)
-        _parse_projects(response, tailored)
-        _parse_skills(response, tailored)
-        _parse_education(response, tailored)
-        _parse_research_publications(response, tailored)
+        Returns one TailoredResumeData per job, in the same order as ``jobs``,
+        or None where that job's response could not be parsed.
+        """
+        results: List[Optional[TailoredResumeData]] = [None] * len(jobs)
+        for i, tailored in self._iter_tailored_content(jobs):
+            results[i] = tailored
+        return results
+    
+    def _iter_tailored_content(self, jobs: List) -> Iterator[Tuple[int, Optional[TailoredResumeData]]]:
+        """Yield (index, TailoredResumeData) per job as soon as each is ready.
         
-        return tailored
+        Cache hits come first, then each LLM miss as its stream finishes. A job
+        whose response could not be generated or parsed yields None, so one
+        bad posting does not end the batch.
+        """
+        prefix = self._get_prompt_prefix()
+        suffixes = [self._build_job_suffix(job) for job in jobs]
+        cache = get_response_cache()
+        match_keys = [_cache_match_kwargs(job) for job in jobs]
+        responses = [
+            cache.get(prefix, suffix, **match) if cache else None
+            for suffix, match in zip(suffixes, match_keys)
+        ]
         
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if len(misses) < len(jobs):
+            logger.info(f"LLM cache: {len(jobs) - len(misses)}/{len(jobs)} tailoring responses reused")
+        hits = [i for i, response in enumerate(responses) if response is not None]
+        if hits:
+            try:
+                parsed = parse_llm_responses([responses[i] for i in hits])
+            except Exception as e:
+                logger.error(f"Failed to parse cached tailoring responses: {e}")
+                parsed = [self._parse_or_none(responses[i]) for i in hits]
+            yield from zip(hits, parsed)
+        if misses:
+            try:
+                llm = get_local_llm(cfg.tailor_model_path)
+            except Exception as e:
+                logger.error(f"Failed to load tailoring model: {e}")
+                for i in misses:
+                    yield i, None
+                return
+            for i in misses:
+                try:
+                    response, tailored = self._stream_tailored(llm, prefix + suffixes[i])
+                    if cache and response and tailored is not None:
+                        cache.put(prefix, suffixes[i], response, **match_keys[i])
+                except Exception as e:
+                    logger.error(f"Tailoring failed for {getattr(jobs[i], 'job_id', i)}: {e}")
+                    tailored = None
+                yield i, tailored
+    
+    def _parse_or_none(self, response: str) -> Optional[TailoredResumeData]:
+        try:
+            return parse_llm_response(response)
+        except Exception as e:
+            logger.error(f"Failed to parse tailoring response: {e}")
+            return None
+    
+    def _stream_tailored(self, llm, prompt: str) -> Tuple[str, Optional[TailoredResumeData]]:
+        """Stream one completion through the incremental parser.
+        
+        Returns the (stripped) response text and its parsed TailoredResumeData,
+        or None in its place if the response could not be parsed or held no
+        content, so that it is not cached.
+        """
+        parser = StreamingResponseParser()
+        stream = llm.stream(prompt, max_tokens=cfg.tailor_max_tokens)
+        try:
+            for chunk in stream:
+                if parser.feed(chunk):
+                    break
+            tailored = parser.finish()
+            if tailored.is_empty():
+                logger.warning("Tailoring response held no usable content")
+                return parser.text.strip(), None
+            return parser.text.strip(), tailored
+        except Exception as e:
+            logger.error(f"Failed to parse tailoring response: {e}")
+            return parser.text.strip(), None
+        finally:
+            stream.close()
+    
+    def tailor_many(
+        self,
+        jobs: List,
+        output_paths: List[str],
+        pool: Optional[ProcessPoolExecutor] = None
+    ) -> List[Optional[str]]:
+        """Tailor and write resumes for several jobs.
+        
+        The LLM runs in this process, one job after another; the DOCX
+        assembly (XML building, zip deflate) is CPU-bound and independent per
+        job, so it runs on a process pool that scales past the GIL. Pass
+        ``pool`` (see create_docx_pool) to share one across calls; otherwise a
+        pool is created and shut down for this call.
+        Each job's document is submitted as soon as its content is ready, so
+        documents are built while the LLM is still working on later jobs.
+        
+        Every submitted build is waited for before returning, even if
+        tailoring stops early, so no worker is still writing an output path
+        once the caller sees it as failed.
+        
+        Returns the saved path per job (same order as ``jobs``), or None
+        where that job's resume could not be created.
+        """
+        if pool is None:
+            with create_docx_pool() as own_pool:
+                return self.tailor_many(jobs, output_paths, own_pool)
+        
+        futures: List[Optional[Future]] = [None] * len(jobs)
+        try:
+            for i, tailored in self._iter_tailored_content(jobs):
+                if tailored is None:
+                    continue
+                futures[i] = pool.submit(_build_resume_document, self.profile, jobs[i], tailored, output_paths[i])
+        except Exception as e:
+            logger.error(f"Batch tailoring stopped early: {e}")
+        
+        written: List[Optional[str]] = [None] * len(jobs)
+        for i, future in enumerate(futures):
+            if future is None:
+                continue
+            try:
+                written[i] = future.result()
+            except Exception as e:
+                logger.error(f"Resume build failed for {getattr(jobs[i], 'job_id', i)}: {e}")
+        return written
+    
     def create_tailored_resume(
         self, 
         tailored_data: TailoredResumeData,
@@ -119,7 +316,11 @@ class ResumeTailor:
             # First, ensure all required styles exist
             self._ensure_styles_exist(doc)
             
-            # Process each section
+            # Index headings once so section lookups don't rescan the document
+            self._heading_index = self._build_heading_index(doc)
+            
+            # Process each section; each updater writes its content just before
+            # the heading that follows the (cleared) section
             sections = [
                 ("SUMMARY", self._update_summary_section, tailored_data.summary, True),
                 ("EXPERIENCE", self._update_experience_section, tailored_data.experience, True),
@@ -131,24 +332,34 @@ class ResumeTailor:
             ]
             
             for section_name, update_func, section_data, required in sections:
-                if not section_data and required:
-                    logger.warning(f"Missing data for required section: {section_name}")
+                # Skip empty sections before any heading lookup or insertion
+                if not section_data:
+                    if required:
+                        logger.warning(f"Missing data for required section: {section_name}")
                     continue
                     
                 try:
                     logger.info(f"Updating {section_name} section...")
                     
-                    # Find or create section heading
-                    heading = self._find_section_heading(doc, section_name)
-                    if not heading:
-                        # Add a new section if it doesn't exist
-                        if doc.paragraphs and doc.paragraphs[-1].text.strip():
+                    # Find the section heading under any of its names, or add it
+                    heading = next(
+                        (para for name in _SECTION_HEADINGS[section_name]
+                         if (para := self._find_section_heading(doc, name))),
+                        None
+                    )
+                    if heading:
+                        # Clear the old content; new content goes before the next heading
+                        next_heading = self._clear_until_next_heading(heading)
+                    else:
+                        # Add a new section at the end if it doesn't exist
+                        last = last_paragraph(doc)
+                        if last is not None and last.text.strip():
                             doc.add_paragraph()  # Add spacing
-                        heading = doc.add_heading(section_name.title(), level=1)
-                        doc.add_paragraph()  # Add spacing after heading
+                        self._add_section_heading(doc, section_name.title())
+                        next_heading = None
                     
                     # Update the section content
-                    update_func(doc, section_data)
+                    update_func(doc, section_data, next_heading)
                     
                 except Exception as e:
                     logger.warning(f"Failed to update {section_name} section: {str(e)}")
@@ -158,6 +369,8 @@ class ResumeTailor:
             logger.error(f"Error updating template: {str(e)}")
             logger.debug("Error details:", exc_info=True)
             raise
+        finally:
+            self._heading_index = None
             
     def _ensure_styles_exist(self, doc: Document) -> None:
         """Ensure all required styles exist in the document."""
@@ -165,287 +378,215 @@ class ResumeTailor:
             'Title', 'Subtitle', 'Heading 1', 'Heading 2', 'Heading 3',
             'Normal', 'List Bullet', 'List Number', 'Strong', 'Emphasis'
         ]
-        
-        for style_name in required_styles:
-            get_or_create_style(doc, style_name)
+        ensure_styles(doc, required_styles)
             
         # Ensure proper list numbering
-        self._ensure_numbering(doc)
+        ensure_list_numbering(doc)
     
     def _build_resume_from_scratch(
         self, 
         tailored_data: TailoredResumeData
     ) -> Document:
-        """Build complete resume from scratch when no template available."""
+        """Build complete resume from scratch when no template available.
+        
+        Plain paragraphs are collected as (text, style) pairs and appended in
+        bulk; the pending batch is flushed before entries that need run-level
+        formatting so document order is preserved.
+        """
         doc = Document()
+        items: List[tuple] = []
+        
+        def section(title: str) -> None:
+            # Same shape as add_section: level-2 heading plus a spacer line
+            items.append((title, 'Heading 2'))
+            items.append(('', 'Normal'))
+        
+        def flush() -> None:
+            if items:
+                bulk_add_paragraphs(doc, items)
+                items.clear()
         
         # Add name and contact info
-        if hasattr(self.profile, 'name') and self.profile.name:
-            add_paragraph_with_style(doc, self.profile.name, 'Heading 1')
+        if getattr(self.profile, 'name', None):
+            items.append((self.profile.name, 'Heading 1'))
         
         # Add summary
         if tailored_data.summary:
-            add_section(doc, "SUMMARY")
-            add_paragraph_with_style(doc, tailored_data.summary)
+            section("SUMMARY")
+            items.append((tailored_data.summary, 'Normal'))
         
         # Add experience
         if tailored_data.experience:
-            add_section(doc, "EXPERIENCE")
+            section("EXPERIENCE")
+            flush()
             for exp in tailored_data.experience:
                 self._add_experience_entry(doc, exp)
         
         # Add projects
         if tailored_data.projects:
-            add_section(doc, "PROJECTS")
+            section("PROJECTS")
+            flush()
             for proj in tailored_data.projects:
                 self._add_project_entry(doc, proj)
         
         # Add skills
         if tailored_data.technical_skills:
-            add_section(doc, "SKILLS")
+            section("SKILLS")
             for category, skills in tailored_data.technical_skills.items():
-                add_paragraph_with_style(doc, f"{category}: {', '.join(skills)}")
+                items.append((f"{category}: {', '.join(skills)}", 'Normal'))
         
         # Add education
         if tailored_data.education:
-            add_section(doc, "EDUCATION")
+            section("EDUCATION")
             for edu in tailored_data.education:
                 if isinstance(edu, dict):
-                    add_paragraph_with_style(doc, f"{edu.get('degree', '')}, {edu.get('institution', '')} ({edu.get('year', '')})")
+                    school = edu.get('school') or edu.get('institution', '')
+                    date = edu.get('date') or edu.get('year', '')
+                    items.append((f"{edu.get('degree', '')}, {school} ({date})", 'Normal'))
                 else:
-                    add_paragraph_with_style(doc, str(edu))
+                    items.append((str(edu), 'Normal'))
         
         # Add research publications if they exist
         if tailored_data.research_publications:
-            add_section(doc, "RESEARCH & PUBLICATIONS")
+            section("RESEARCH & PUBLICATIONS")
             for pub in tailored_data.research_publications:
-                add_paragraph_with_style(doc, f"• {pub}")
+                items.append((f"• {_publication_text(pub)}", 'Normal'))
         
+        flush()
         return doc
     
-    def _update_summary_section(self, doc: Document, summary: str) -> None:
-        """Update the summary section in the template while preserving formatting."""
-        if not summary:
-            return
-            
-        # Find the summary section
-        summary_para = self._find_section_heading(doc, "SUMMARY")
-        if not summary_para:
-            # If no summary section exists, add it after the first paragraph
-            if len(doc.paragraphs) > 0:
-                # Insert after the first paragraph (contact info)
-                doc.paragraphs[0].insert_paragraph_before("SUMMARY", style='Heading 1')
-                doc.paragraphs[1].insert_paragraph_before(summary, style='Body Text')
-            else:
-                doc.add_heading("SUMMARY", level=1)
-                doc.add_paragraph(summary, style='Body Text')
-            return
-            
-        # Clear existing content until next heading
-        next_para = self._clear_until_next_heading(summary_para)
-        
-        # Add the new summary with preserved formatting
-        if next_para:
-            next_para.insert_paragraph_before(summary, style='Body Text')
-        else:
-            summary_para.insert_paragraph_before(summary, style='Body Text')
-            
-    def _update_experience_section(self, doc: Document, experience: List[Dict]) -> None:
-        """Update the experience section in the template while preserving formatting."""
-        if not experience:
-            return
-            
-        exp_heading = self._find_section_heading(doc, "EXPERIENCE")
-        if not exp_heading:
-            # If no experience section exists, add it
-            doc.add_heading("EXPERIENCE", level=1)
-            for exp in experience:
-                self._add_experience_entry(doc, exp)
-            return
-            
-        # Clear existing content until next section
-        next_para = self._clear_until_next_heading(exp_heading)
-        
-        # Add new experience entries
+    def _update_summary_section(self, doc: Document, summary: str, before: Optional[Paragraph] = None) -> None:
+        """Write the summary paragraph before ``before``."""
+        add_paragraph_with_style(doc, summary, 'Body Text', before=before)
+        self._end_section(doc, before)
+            
+    def _update_experience_section(self, doc: Document, experience: List[Dict],
+                                   before: Optional[Paragraph] = None) -> None:
+        """Write the experience entries before ``before``, a blank line between entries."""
         for i, exp in enumerate(experience):
-            # Add a blank line between entries, but not after the last one
             if i > 0:
-                if next_para:
-                    next_para.insert_paragraph_before('')
-                else:
-                    doc.add_paragraph('')
-            
-            # Add the experience entry
-            self._add_experience_entry(doc, exp)
-            
-        # Ensure there's a blank line after the section
-        if next_para and next_para.text.strip() != '':
-            next_para.insert_paragraph_before('')
+                add_paragraph_with_style(doc, '', before=before)
+            self._add_experience_entry(doc, exp, before)
+        self._end_section(doc, before)
     
-    def _add_experience_entry(self, doc: Document, exp: Dict) -> None:
-        """Add a single experience entry to the document with proper formatting."""
-        # Build job header with title, company, and duration
-        job_header = []
-        if 'title' in exp and exp['title']:
-            job_header.append(exp['title'])
-        if 'company' in exp and exp['company']:
-            job_header.append(exp['company'])
-        if 'location' in exp and exp['location']:
-            job_header.append(exp['location'])
+    def _add_experience_entry(self, doc: Document, exp: Dict, before: Optional[Paragraph] = None) -> None:
+        """Add a single experience entry to the document with proper formatting.
+        
+        The whole entry is rendered as one WordprocessingML fragment and
+        inserted with a single parse, rather than building each paragraph and
+        run through the python-docx wrappers.
+        """
+        parts = []
+        
+        # Build job header from whichever of title, company and location are set
+        job_header = ' • '.join(v for k in ('title', 'company', 'location') if (v := exp.get(k)))
             
         # Add the job header with proper formatting
         if job_header:
-            # Use a strong style for the job title/company line
-            p = doc.add_paragraph(style='Normal')
-            p.add_run(' • '.join(job_header)).bold = True
-            
-            # Add duration on the same line, right-aligned if available
-            if 'duration' in exp and exp['duration']:
-                from docx.enum.text import WD_ALIGN_PARAGRAPH
-                p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                p.add_run('\t')  # Tab to push duration to the right
-                p.add_run(exp['duration']).italic = True
-        
-        # Add bullet points with proper indentation
-        bullets = exp.get('bullets', [])
+            # Bold title/company line; dates on the same line, pushed right
+            # by a tab in a justified paragraph, if available
+            duration = exp.get('dates') or exp.get('duration')
+            header = f'<w:r><w:rPr><w:b/></w:rPr>{xml_run_content(job_header)}</w:r>'
+            if duration:
+                header = (
+                    '<w:pPr><w:jc w:val="both"/></w:pPr>' + header
+                    + '<w:r><w:tab/></w:r>'
+                    + f'<w:r><w:rPr><w:i/></w:rPr>{xml_run_content(duration)}</w:r>'
+                )
+            parts.append(f'<w:p>{header}</w:p>')
+        
+        # Add bullet points with proper indentation, skipping empty ones
+        bullets = [text for b in exp.get('bullets') or () if b and (text := b.strip())]
         if bullets:
-            for bullet in bullets:
-                if bullet.strip():  # Skip empty bullet points
-                    p = doc.add_paragraph(style='List Bullet')
-                    p.paragraph_format.left_indent = 360000  # 0.25 inch in twips
-                    p.paragraph_format.first_line_indent = -360000  # Hanging indent
-                    p.add_run(bullet.strip())
+            style_id = doc.part.get_style_id(get_hanging_bullet_style(doc), WD_STYLE_TYPE.PARAGRAPH)
+            ppr = f'<w:pPr><w:pStyle w:val="{xml_attr(style_id)}"/></w:pPr>' if style_id else ''
+            parts.extend(
+                f'<w:p>{ppr}<w:r>{xml_run_content(bullet)}</w:r></w:p>'
+                for bullet in bullets
+            )
+        
+        if parts:
+            append_body_xml(doc, ''.join(parts), before)
     
-    def _update_skills_section(self, doc: Document, skills: Dict[str, List[str]]) -> None:
-        """Update skills section in the document."""
-        try:
-            # Find skills section or create it
-            skills_heading = self._find_section_heading(doc, "SKILLS")
-            if not skills_heading:
-                skills_heading = doc.add_heading("Skills", level=1)
-                doc.add_paragraph()
-            
-            # Clear existing content until next heading
-            self._clear_until_heading(doc, skills_heading, "SKILLS")
+    def _update_skills_section(self, doc: Document, skills: Dict[str, List[str]],
+                               before: Optional[Paragraph] = None) -> None:
+        """Write one heading and comma-separated line per skill category before ``before``."""
+        for category, skill_list in skills.items():
+            if not skill_list:
+                continue
+                
+            # Add category header
+            add_paragraph_with_style(doc, category.upper(), 'Heading 2', before=before)
             
-            if not skills:
-                logger.warning("No skills data provided to update skills section")
-                return
+            # Add skills as comma-separated list
+            add_paragraph_with_style(doc, ', '.join(skill_list), 'Normal', before=before)
             
-            # Add skills in a clean format
-            for category, skill_list in skills.items():
-                if not skill_list:
-                    continue
-                    
-                # Add category header
-                add_paragraph_with_style(doc, category.upper(), 'Heading 2')
-                
-                # Add skills as comma-separated list
-                skills_text = ', '.join(skill_list)
-                add_paragraph_with_style(doc, skills_text, 'Normal')
-                
-                # Add spacing between categories
-                doc.add_paragraph()
-                
-        except Exception as e:
-            logger.error(f"Error updating skills section: {str(e)}")
-            logger.debug("Error details:", exc_info=True)
-            # Fallback to simple text
-            try:
-                for category, skill_list in skills.items():
-                    doc.add_paragraph(f"{category.upper()}:")
-                    doc.add_paragraph(", ".join(skill_list))
-            except Exception as e:
-                logger.error(f"Failed to add fallback skills content: {e}")
+            # Add spacing between categories
+            add_paragraph_with_style(doc, '', before=before)
     
-    def _update_projects_section(self, doc: Document, projects: List[Dict]) -> None:
-        """Update the projects section in the template with improved formatting."""
-        if not projects:
-            return
-            
-        # Try different possible section headings
-        section_names = ["PROJECTS", "PERSONAL PROJECTS", "SIDE PROJECTS"]
-        proj_heading = None
-        
-        for name in section_names:
-            proj_heading = self._find_section_heading(doc, name)
-            if proj_heading:
-                break
-        
-        if not proj_heading:
-            # If no projects section exists, add it
-            doc.add_heading("PROJECTS", level=1)
-            next_para = None
-        else:
-            # Clear existing content until next section
-            next_para = self._clear_until_next_heading(proj_heading)
-        
-        # Add projects with consistent formatting
+    def _update_projects_section(self, doc: Document, projects: List[Dict],
+                                 before: Optional[Paragraph] = None) -> None:
+        """Write the project entries before ``before``, a blank line between entries."""
         for i, proj in enumerate(projects):
-            # Add a blank line between entries, but not before the first one
-            if i > 0 and next_para:
-                next_para.insert_paragraph_before('')
-            
-            # Add project title and details
-            if isinstance(proj, dict):
-                # Add project name and optional link/date
-                title_parts = []
-                if proj.get('name'):
-                    title_parts.append(proj['name'])
-                if proj.get('technologies'):
-                    if isinstance(proj['technologies'], list):
-                        tech_str = ', '.join(proj['technologies'])
-                    else:
-                        tech_str = str(proj['technologies'])
-                    title_parts.append(f"Technologies: {tech_str}")
-                
-                title = ' | '.join(title_parts)
-                add_paragraph_with_style(doc, title, style='Heading 2')
-                
-                # Add project description points
-                if proj.get('description'):
-                    if isinstance(proj['description'], str):
-                        # Split by newlines if it's a string
-                        points = [p.strip() for p in proj['description'].split('\n') if p.strip()]
-                    else:
-                        points = proj['description']
-                    
-                    for point in points:
-                        if point.strip():
-                            add_bullet_points(doc, [point])
-            else:
-                # Fallback for string project entries
-                add_paragraph_with_style(doc, str(proj), style='Body Text')
-        
-        # Add a blank line after the section
-        if next_para and next_para.text.strip() != '':
-            next_para.insert_paragraph_before('')
+            if i > 0:
+                add_paragraph_with_style(doc, '', before=before)
+            self._add_project_entry(doc, proj, before)
+        self._end_section(doc, before)
     
-    def _update_education_section(self, doc: Document, education: List) -> None:
-        """Update the education section in the template with improved formatting."""
-        if not education:
-            return
-            
-        edu_heading = self._find_section_heading(doc, "EDUCATION")
-        if not edu_heading:
-            # If no education section exists, add it
-            doc.add_heading("EDUCATION", level=1)
-            next_para = None
+    def _add_project_entry(self, doc: Document, proj, before: Optional[Paragraph] = None) -> None:
+        """Add a single project: a Heading 2 title line, then its description and achievements as bullets."""
+        # Add project title and details
+        if isinstance(proj, dict):
+            # Add project name and optional link/date
+            title_parts = []
+            if proj.get('name'):
+                title_parts.append(proj['name'])
+            if proj.get('technologies'):
+                if isinstance(proj['technologies'], list):
+                    tech_str = ', '.join(proj['technologies'])
+                else:
+                    tech_str = str(proj['technologies'])
+                title_parts.append(f"Technologies: {tech_str}")
+
+            title = ' | '.join(title_parts)
+            add_paragraph_with_style(doc, title, 'Heading 2', before=before)
+
+            # Add project description points
+            if proj.get('description'):
+                if isinstance(proj['description'], str):
+                    # Split by newlines if it's a string
+                    points = [p.strip() for p in proj['description'].split('\n') if p.strip()]
+                else:
+                    points = proj['description']
+
+                cleaned = [point.strip() for point in points if point.strip()]
+                if cleaned:
+                    add_bullet_points(doc, cleaned, before=before)
+
+            # Add achievements after the description
+            achievements = [a.strip() for a in proj.get('achievements') or () if a and a.strip()]
+            if achievements:
+                add_bullet_points(doc, achievements, before=before)
         else:
-            # Clear existing content until next section
-            next_para = self._clear_until_next_heading(edu_heading)
-        
-        # Add education entries with consistent formatting
+            # Fallback for string project entries
+            add_paragraph_with_style(doc, str(proj), 'Body Text', before=before)
+    
+    def _update_education_section(self, doc: Document, education: List,
+                                  before: Optional[Paragraph] = None) -> None:
+        """Write the education entries before ``before``, one borderless table row each."""
         for i, edu in enumerate(education):
-            if i > 0 and next_para:
-                next_para.insert_paragraph_before('')
+            if i > 0:
+                add_paragraph_with_style(doc, '', before=before)
             
-            # Create a table for each education entry to align degree and date
-            from docx.shared import Inches
-            from docx.enum.table import WD_TABLE_ALIGNMENT
+            if not isinstance(edu, dict):
+                # The regex fallback parser yields plain lines
+                add_paragraph_with_style(doc, str(edu), 'Body Text', before=before)
+                continue
             
             # Create a table with 2 columns (degree and date)
             table = doc.add_table(rows=1, cols=2)
+            if before is not None:
+                before._element.addprevious(table._tbl)
             table.style = 'Table Normal'  # No borders for a clean look
             table.autofit = False
             
@@ -458,170 +599,123 @@ class ResumeTailor:
             p = degree_cell.paragraphs[0]
             
             # Add degree in bold
-            if 'degree' in edu and edu['degree']:
+            if edu.get('degree'):
                 p.add_run(edu['degree']).bold = True
                 
             # Add school name
-            if 'school' in edu and edu['school']:
+            if edu.get('school'):
                 if p.text:  # Add a space if there's already text
                     p.add_run(', ')
                 p.add_run(edu['school'])
                 
             # Add location if available
-            if 'location' in edu and edu['location']:
+            if edu.get('location'):
                 if p.text:  # Add a space if there's already text
                     p.add_run(' | ')
                 p.add_run(edu['location']).italic = True
             
             # Add date (right-aligned)
-            if 'date' in edu and edu['date']:
+            if edu.get('date'):
                 date_cell = table.cell(0, 1)
                 date_cell.paragraphs[0].alignment = WD_TABLE_ALIGNMENT.RIGHT
                 date_cell.paragraphs[0].add_run(edu['date']).italic = True
             
             # Add any additional details (GPA, honors, etc.)
-            if 'details' in edu and edu['details']:
-                details = edu['details']
-                if isinstance(details, str):
-                    doc.add_paragraph(details, style='Body Text')
-                elif isinstance(details, list):
-                    for detail in details:
-                        if detail.strip():
-                            doc.add_paragraph(detail, style='Body Text')
-        
-        # Add a blank line after the section
-        if next_para and next_para.text.strip() != '':
-            next_para.insert_paragraph_before('')
+            details = edu.get('details')
+            if isinstance(details, str):
+                details = [details]
+            for detail in details or ():
+                if detail.strip():
+                    add_paragraph_with_style(doc, detail, 'Body Text', before=before)
+        
+        self._end_section(doc, before)
     
-    def _update_research_publications(self, doc: Document, publications: List[str]) -> None:
-        """Update the research publications section in the template with improved formatting."""
-        if not publications:
-            return
-            
-        # Try different possible section headings
-        section_names = ["RESEARCH & PUBLICATIONS", "PUBLICATIONS", "RESEARCH"]
-        pub_heading = None
-        
-        for name in section_names:
-            pub_heading = self._find_section_heading(doc, name)
-            if pub_heading:
-                break
-        
-        if not pub_heading:
-            # If no publications section exists, add it
-            doc.add_heading("RESEARCH & PUBLICATIONS", level=1)
-            next_para = None
-        else:
-            # Clear existing content until next section
-            next_para = self._clear_until_next_heading(pub_heading)
-        
-        # Add publications with proper formatting
-        for i, pub in enumerate(publications):
-            if not pub.strip():
-                continue
-                
-            # Add a blank line between publications, but not before the first one
-            if i > 0 and next_para:
-                next_para.insert_paragraph_before('')
-            
-            # Create a paragraph for the publication
-            p = doc.add_paragraph(style='List Bullet')
-            p.paragraph_format.left_indent = 360000  # 0.25 inch in twips
-            p.paragraph_format.first_line_indent = -360000  # Hanging indent
-            
-            # Add publication text with proper formatting
-            p.add_run(pub.strip())
-        
-        # Add a blank line after the section
-        if next_para and next_para.text.strip() != '':
-            next_para.insert_paragraph_before('')
+    def _update_research_publications(self, doc: Document, publications: List,
+                                      before: Optional[Paragraph] = None) -> None:
+        """Write one hanging bullet per publication before ``before``."""
+        bullet_style = get_hanging_bullet_style(doc).name
+        for pub in publications:
+            text = _publication_text(pub)
+            if text:
+                add_paragraph_with_style(doc, text, bullet_style, before=before)
+        self._end_section(doc, before)
+    
+    def _end_section(self, doc: Document, before: Optional[Paragraph]) -> None:
+        """Leave a blank line between a rewritten section and the heading after it."""
+        if before is not None:
+            add_paragraph_with_style(doc, '', before=before)
+    
+    def _build_heading_index(self, doc: Document) -> Dict[str, object]:
+        """Map upper-cased paragraph text to its first paragraph in one pass."""
+        index = {}
+        for para in doc.paragraphs:
+            index.setdefault(para.text.upper(), para)
+        return index
     
-    def _find_section_heading(self, doc: Document, section_name: str):
-        """Find a section heading in the document."""
+    def _add_section_heading(self, doc: Document, text: str, level: int = 1):
+        """Append a heading and register it in the heading index, if one is active."""
+        # Resolved through the case-insensitive style index: templates often
+        # store built-in names as "Heading 1", which doc.add_heading can't find
+        heading = add_paragraph_with_style(doc, text, f'Heading {level}')
+        index = self._heading_index
+        if index is not None:
+            existing = index.get(text.upper())
+            if existing is None or existing._element.getparent() is None:
+                index[text.upper()] = heading
+        return heading
+    
+    def _find_section_heading(self, doc: Document, section_name: str, index: Optional[Dict[str, object]] = None):
+        """Find a section heading in the document.
+        
+        Uses ``index`` (or the index built for the template update in progress)
+        when available, falling back to a linear scan of the paragraphs.
+        """
         section_name = section_name.upper()
+        if index is None:
+            index = self._heading_index
+        if index is not None:
+            para = index.get(section_name)
+            # Skip headings that were removed while clearing earlier sections
+            if para is not None and para._element.getparent() is not None:
+                return para
+            return None
         for para in doc.paragraphs:
-            # Check if paragraph text matches the section name (case-insensitive)
-            # Also check if it's a heading style
-            if (para.text.upper() == section_name or 
-                (hasattr(para, 'style') and 
-                 para.style.name.startswith('Heading') and 
-                 para.text.upper() == section_name)):
+            # Read the text once per paragraph; a text match alone decides it
+            # (the old heading-style check was subsumed by the same comparison),
+            # so the style XML is never touched
+            text = para.text
+            if text and text.upper() == section_name:
                 return para
         return None
     
-    def _clear_until_heading(self, doc: Document, start_para, target_heading: str):
+    def _clear_until_next_heading(self, para):
         """
-        Clear content from start_para until the next heading.
+        Remove the paragraphs following ``para`` up to the next section heading.
+        
+        Only Heading 1 / Title paragraphs end a section; the Heading 2 entry
+        titles inside it (jobs, projects) are cleared with the rest. Walks the
+        sibling chain directly with ``getnext()`` instead of re-listing the
+        body's paragraphs. Only ``w:p`` siblings are removed, so tables and the
+        trailing sectPr are left in place.
         
         Args:
-            doc: The document
-            start_para: The starting paragraph
-            target_heading: The heading text to find (case-insensitive)
+            para: The section heading paragraph
             
         Returns:
-            The next heading paragraph, or None if not found
+            The next section heading paragraph, or None if the section runs to the end
         """
-        try:
-            if not hasattr(start_para, '_element'):
-                return None
-                
-            # Get the parent element containing paragraphs
-            parent = start_para._element.getparent()
-            if parent is None:
-                return None
-                
-            # Get all paragraphs
-            all_paras = list(parent.iterchildren('w:p'))
-            if not all_paras:
-                return None
-                
-            # Find the starting index
-            start_idx = None
-            for i, p in enumerate(all_paras):
-                if p == start_para._element:
-                    start_idx = i
-                    break
-                    
-            if start_idx is None:
-                return None
-                
-            # Find the next heading
-            next_heading = None
-            for i in range(start_idx + 1, len(all_paras)):
-                p = all_paras[i]
-                
-                # Check if this is a heading
-                is_heading = False
-                style_name = p.xpath('.//w:pStyle/@w:val')
-                if style_name:
-                    style_name = style_name[0].lower()
-                    is_heading = style_name.startswith('heading') or style_name in ['title', 'subtitle']
-                
-                # Check if this is our target heading
-                para_text = ''.join(node.text for node in p.xpath('.//w:t') if node.text)
-                if is_heading and target_heading.lower() in para_text.lower():
-                    next_heading = p
-                    break
-                    
-            # Clear content between start_para and next_heading
-            end_idx = all_paras.index(next_heading) if next_heading else len(all_paras)
-            
-            # Keep the start_para but clear its content
-            if start_para._element.text:
-                start_para.clear()
-                
-            # Remove paragraphs between start and end
-            for i in range(start_idx + 1, end_idx):
-                if i < len(all_paras):
-                    try:
-                        p = all_paras[i]
-                        p.getparent().remove(p)
-                    except Exception as e:
-                        logger.warning(f"Error removing paragraph: {e}")
-                        continue
-            
-            return next_heading
-            
-        except Exception as e:
-            logger.warning(f"Error in _clear_until_heading: {e}")
+        start_el = para._element
+        if start_el.getparent() is None:
             return None
+        
+        elem = start_el.getnext()
+        while elem is not None:
+            following = elem.getnext()
+            if elem.tag == _W_P:
+                pPr = elem.find(_W_PPR)
+                pStyle = pPr.find(_W_PSTYLE) if pPr is not None else None
+                if pStyle is not None and pStyle.get(_W_VAL, '').lower() in _SECTION_STYLE_IDS:
+                    return Paragraph(elem, para._parent)
+                elem.getparent().remove(elem)
+            elem = following
+        return None
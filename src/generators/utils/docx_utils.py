@@ -1,31 +1,82 @@
 import logging
-from typing import List
+import re
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
 from docx import Document
 from docx.enum.style import WD_STYLE_TYPE
-from docx.shared import Pt, Inches
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.shared import Emu, Pt, Inches
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import parse_xml
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.parts.numbering import NumberingPart
+from docx.text.paragraph import Paragraph
 
 logger = logging.getLogger("tailor")
 
+# Bullet style with the hanging indent baked in, so bullets need no per-paragraph formatting
+HANGING_BULLET_STYLE = 'BulletHang'
+BULLET_INDENT = Emu(360000)
+
+_W_P = qn('w:p')
+# Characters python-docx's run.text setter turns into <w:tab/> / <w:br/>
+_RUN_SPECIAL_CHARS = re.compile(r'([\t\n\r])')
+
+# Numbering + indent (in twips) for a top-level list paragraph
+_LIST_PROPS_XML = (
+    '<w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr>'
+    '<w:ind w:left="360" w:hanging="360"/>'
+)
+
+# Numbering part for documents that have none: numId 1 (used by _LIST_PROPS_XML) as a bullet list
+_BULLET_NUMBERING_XML = (
+    f'<w:numbering {nsdecls("w")}>'
+    '<w:abstractNum w:abstractNumId="0">'
+    '<w:multiLevelType w:val="hybridMultilevel"/>'
+    '<w:lvl w:ilvl="0"><w:start w:val="1"/><w:numFmt w:val="bullet"/>'
+    '<w:lvlText w:val="•"/><w:lvlJc w:val="left"/>'
+    '<w:pPr><w:ind w:left="360" w:hanging="360"/></w:pPr></w:lvl>'
+    '</w:abstractNum>'
+    '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+    '</w:numbering>'
+)
+
+# Formatting for styles created by _create_style, keyed by lower-cased name
+_DEFAULT_FONT_SIZE = Pt(11)
+_STYLE_CONFIG = {
+    'heading 1': {'size': Pt(16), 'bold': True, 'space_after': Pt(12)},
+    'heading 2': {'size': Pt(14), 'bold': True, 'space_after': Pt(6)},
+    'heading 3': {'size': Pt(12), 'bold': True, 'italic': True, 'space_after': Pt(6)},
+    'title': {'size': Pt(18), 'bold': True, 'space_after': Pt(18)},
+    'subtitle': {'size': Pt(14), 'italic': True, 'space_after': Pt(12)},
+    'list bullet': {'size': Pt(11), 'space_before': Pt(0), 'space_after': Pt(0)},
+    'list': {'size': Pt(11), 'space_before': Pt(0), 'space_after': Pt(0)},
+    'normal': {'size': Pt(11), 'space_after': Pt(6)},
+}
+_LIST_INDENT = Inches(0.25)
+
+# Lower-cased style name -> style, built once per document (keyed by its part)
+_style_indexes = weakref.WeakKeyDictionary()
+
+def _style_index(doc: Document) -> Dict[str, object]:
+    """Return the document's style index, walking doc.styles only the first time."""
+    index = _style_indexes.get(doc.part)
+    if index is None:
+        index = {}
+        for style in doc.styles:
+            if style.name:
+                index.setdefault(style.name.lower(), style)
+        _style_indexes[doc.part] = index
+    return index
+
 def get_or_create_style(doc: Document, style_name: str, style_type=WD_STYLE_TYPE.PARAGRAPH):
     """Get existing style or create it if it doesn't exist, with fallback to Normal."""
     try:
-        # First try to get the style directly
-        if style_name in doc.styles:
-            return doc.styles[style_name]
-            
-        # Try common variations of the style name
-        variations = [
-            style_name,
-            style_name.lower(),
-            style_name.upper(),
-            style_name.title(),
-        ]
-        
-        for variation in variations:
-            if variation in doc.styles:
-                return doc.styles[variation]
+        # Case-insensitive lookup in the per-document index
+        style = _style_index(doc).get(style_name.lower())
+        if style is not None:
+            return style
                 
         # If style doesn't exist, create it
         return _create_style(doc, style_name, style_type)
@@ -34,39 +85,49 @@ def get_or_create_style(doc: Document, style_name: str, style_type=WD_STYLE_TYPE
         logger.warning(f"Error getting style '{style_name}': {e}")
         return doc.styles.get('Normal', doc.styles['Default Paragraph Font'])
 
+def get_hanging_bullet_style(doc: Document):
+    """Get the hanging-indent bullet style, creating it (based on 'List Bullet') once per document."""
+    index = _style_index(doc)
+    style = index.get(HANGING_BULLET_STYLE.lower())
+    if style is not None:
+        return style
+    style = doc.styles.add_style(HANGING_BULLET_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = get_or_create_style(doc, 'List Bullet')
+    style.paragraph_format.left_indent = BULLET_INDENT
+    style.paragraph_format.first_line_indent = Emu(-BULLET_INDENT)
+    index[HANGING_BULLET_STYLE.lower()] = style
+    return style
+
+def ensure_styles(doc: Document, style_names: Iterable[str], style_type=WD_STYLE_TYPE.PARAGRAPH) -> None:
+    """Create any of style_names missing from doc, using the document's style index."""
+    existing = _style_index(doc)
+    for style_name in style_names:
+        if style_name.lower() not in existing:
+            _create_style(doc, style_name, style_type)
+
 def _create_style(doc: Document, style_name: str, style_type):
     """Create a new style with the given name and type."""
     try:
         # Check if style already exists (case-insensitive)
-        for existing_style in doc.styles:
-            if existing_style.name.lower() == style_name.lower():
-                return existing_style
+        index = _style_index(doc)
+        existing_style = index.get(style_name.lower())
+        if existing_style is not None:
+            return existing_style
         
         # Create new style
         style = doc.styles.add_style(style_name, style_type)
+        index[style_name.lower()] = style
         
         # Set font properties
         font = style.font
         font.name = 'Calibri'
-        font.size = Pt(11)
-        
-        # Configure style based on name
-        style_config = {
-            'heading 1': {'size': 16, 'bold': True, 'space_after': Pt(12)},
-            'heading 2': {'size': 14, 'bold': True, 'space_after': Pt(6)},
-            'heading 3': {'size': 12, 'bold': True, 'italic': True, 'space_after': Pt(6)},
-            'title': {'size': 18, 'bold': True, 'space_after': Pt(18)},
-            'subtitle': {'size': 14, 'italic': True, 'space_after': Pt(12)},
-            'list bullet': {'size': 11, 'space_before': Pt(0), 'space_after': Pt(0)},
-            'list': {'size': 11, 'space_before': Pt(0), 'space_after': Pt(0)},
-            'normal': {'size': 11, 'space_after': Pt(6)},
-        }
+        font.size = _DEFAULT_FONT_SIZE
         
-        # Apply style configuration
-        config = style_config.get(style_name.lower(), style_config['normal'])
+        # Apply style configuration based on name
+        config = _STYLE_CONFIG.get(style_name.lower(), _STYLE_CONFIG['normal'])
         
         if 'size' in config:
-            font.size = Pt(config['size'])
+            font.size = config['size']
         if 'bold' in config:
             font.bold = config['bold']
         if 'italic' in config:
@@ -78,8 +139,8 @@ def _create_style(doc: Document, style_name: str, style_type):
         
         # For list styles, ensure proper indentation
         if 'list' in style_name.lower():
-            style.paragraph_format.left_indent = Inches(0.25)
-            style.paragraph_format.first_line_indent = Inches(-0.25)
+            style.paragraph_format.left_indent = _LIST_INDENT
+            style.paragraph_format.first_line_indent = Emu(-_LIST_INDENT)
         
         return style
         
@@ -88,7 +149,14 @@ def _create_style(doc: Document, style_name: str, style_type):
         # Return Normal style as fallback
         return doc.styles.get('Normal', None)
 
-def add_paragraph_with_style(doc: Document, text: str, style_name: str = None, **kwargs):
+def _new_paragraph(doc: Document, before: Optional[Paragraph], style=None) -> Paragraph:
+    # At the end of the body, or just before ``before`` when one is given
+    if before is not None:
+        return before.insert_paragraph_before(style=style)
+    return doc.add_paragraph(style=style)
+
+def add_paragraph_with_style(doc: Document, text: str, style_name: str = None,
+                             before: Optional[Paragraph] = None, **kwargs):
     """
     Add paragraph with style, handling missing styles gracefully.
     
@@ -96,51 +164,134 @@ def add_paragraph_with_style(doc: Document, text: str, style_name: str = None, *
         doc: The document to add the paragraph to
         text: The text content of the paragraph
         style_name: The name of the style to apply
+        before: Insert just before this paragraph instead of at the end of the body
         **kwargs: Additional formatting options (bold, italic, etc.)
         
     Returns:
         The created paragraph
     """
+    # Handle empty or whitespace-only text
+    if not text or not str(text).strip():
+        return _new_paragraph(doc, before)
+        
+    # Get or create the style
+    style = None
+    if style_name:
+        style = get_or_create_style(doc, style_name)
+    
+    # Add the paragraph with the specified style
+    para = _new_paragraph(doc, before, style)
+    
+    # Add runs with formatting
+    run = para.add_run(text)
+    
+    # Apply formatting from kwargs
+    if 'bold' in kwargs:
+        run.bold = kwargs['bold']
+    if 'italic' in kwargs:
+        run.italic = kwargs['italic']
+    if 'underline' in kwargs:
+        run.underline = kwargs['underline']
+    if 'font_size' in kwargs:
+        run.font.size = Pt(kwargs['font_size'])
+    if 'font_name' in kwargs:
+        run.font.name = kwargs['font_name']
+    if 'color' in kwargs:
+        run.font.color.rgb = kwargs['color']
+        
+    return para
+
+def ensure_list_numbering(doc: Document) -> None:
+    """
+    Make sure the document has numbering definitions for add_bullet_points.
+    
+    Templates saved without any lists have no numbering part, so numId 1
+    would point at nothing. python-docx cannot create that part itself
+    (NumberingPart.new is not implemented), so a minimal one defining numId 1
+    as a bullet list is added. Existing numbering parts are left untouched.
+    """
     try:
-        # Handle empty or whitespace-only text
+        doc.part.part_related_by(RT.NUMBERING)
+        return
+    except KeyError:
+        pass
+    part = NumberingPart(
+        PackURI('/word/numbering.xml'), CT.WML_NUMBERING,
+        parse_xml(_BULLET_NUMBERING_XML), doc.part.package
+    )
+    doc.part.relate_to(part, RT.NUMBERING)
+
+def bulk_add_paragraphs(doc: Document, items: List[Tuple[str, str]]):
+    """
+    Append many styled paragraphs in one pass over the document body.
+    
+    Each style is resolved once and the <w:p> elements are appended directly
+    to the body XML, avoiding the per-call overhead of add_paragraph_with_style.
+    
+    Args:
+        doc: The document to add the paragraphs to
+        items: (text, style_name) pairs, in document order
+    """
+    body = doc.element.body
+    style_ids: Dict[str, Optional[str]] = {}
+    for text, style_name in items:
+        p = body.add_p()
+        # Empty lines stay unstyled, matching add_paragraph_with_style
         if not text or not str(text).strip():
-            return doc.add_paragraph()
-            
-        # Get or create the style
-        style = None
-        if style_name:
+            continue
+        if style_name not in style_ids:
             style = get_or_create_style(doc, style_name)
-        
-        # Add the paragraph with the specified style
-        para = doc.add_paragraph(style=style) if style else doc.add_paragraph()
-        
-        # Add runs with formatting
-        run = para.add_run(text)
-        
-        # Apply formatting from kwargs
-        if 'bold' in kwargs:
-            run.bold = kwargs['bold']
-        if 'italic' in kwargs:
-            run.italic = kwargs['italic']
-        if 'underline' in kwargs:
-            run.underline = kwargs['underline']
-        if 'font_size' in kwargs:
-            run.font.size = Pt(kwargs['font_size'])
-        if 'font_name' in kwargs:
-            run.font.name = kwargs['font_name']
-        if 'color' in kwargs:
-            run.font.color.rgb = kwargs['color']
-            
-        return para
-        
-    except Exception as e:
-        logger.error(f"Error adding paragraph with style '{style_name}': {e}")
-        # Fallback to basic paragraph
-        try:
-            return doc.add_paragraph(text)
-        except Exception as e:
-            logger.error(f"Failed to add fallback paragraph: {e}")
-            return doc.add_paragraph("Error: Could not add paragraph")
+            style_ids[style_name] = doc.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        if style_ids[style_name]:
+            p.style = style_ids[style_name]
+        p.add_r().text = str(text)
+
+def xml_run_content(text: str) -> str:
+    """Markup for the inside of a <w:r>, as python-docx's ``run.text`` would write it.
+    
+    Text goes into <w:t xml:space="preserve"> elements, tabs become <w:tab/>
+    and each newline or carriage return a <w:br/>.
+    """
+    parts = []
+    for piece in _RUN_SPECIAL_CHARS.split(str(text)):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r'):
+            parts.append('<w:br/>')
+        elif piece:
+            parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+def xml_attr(value: str) -> str:
+    """Escape a value for a double-quoted XML attribute."""
+    return escape(str(value), {'"': '&quot;'})
+
+def append_body_xml(doc: Document, fragment: str, before: Optional[Paragraph] = None) -> None:
+    """
+    Parse a fragment of body-level WordprocessingML once and append it.
+    
+    Elements are inserted before ``before`` when given, otherwise before the
+    trailing w:sectPr, as python-docx does for paragraphs it adds itself.
+    
+    Args:
+        doc: The document to append to
+        fragment: Concatenated <w:p>/<w:tbl> markup using the "w:" prefix
+        before: Paragraph to insert the fragment in front of
+    """
+    container = parse_xml(f'<w:body {nsdecls("w")}>{fragment}</w:body>')
+    anchor = before._element if before is not None else doc.element.body.sectPr
+    for child in list(container):
+        if anchor is not None:
+            anchor.addprevious(child)
+        else:
+            doc.element.body.append(child)
+
+def last_paragraph(doc: Document) -> Optional[Paragraph]:
+    """Return the last body paragraph, or None, without building doc.paragraphs."""
+    for child in reversed(doc.element.body):
+        if child.tag == _W_P:
+            return Paragraph(child, doc._body)
+    return None
 
 def add_section(doc: Document, title: str, level: int = 2):
     """
@@ -152,7 +303,8 @@ def add_section(doc: Document, title: str, level: int = 2):
         level: The heading level (1-3)
     """
     try:
-        if doc.paragraphs and doc.paragraphs[-1].text.strip() != '':
+        last = last_paragraph(doc)
+        if last is not None and last.text.strip() != '':
             doc.add_paragraph('')
         
         heading = doc.add_heading(title, level=min(max(1, level), 3))
@@ -163,55 +315,22 @@ def add_section(doc: Document, title: str, level: int = 2):
         doc.add_paragraph(title, style='Heading 2')
         doc.add_paragraph('')
 
-def add_bullet_points(doc: Document, items: List[str], style_name: str = 'List Bullet'):
-    """Add bullet points to the document."""
-    for item in items:
-        para = add_paragraph_with_style(doc, item, style_name)
-        _set_list_style(para)
-
-def _set_list_style(paragraph, level=0):
-    """
-    Set the list style for a paragraph with proper numbering.
+def add_bullet_points(doc: Document, items: List[str], style_name: str = 'List Bullet',
+                      before: Optional[Paragraph] = None):
+    """Add bullet points to the document as one WordprocessingML fragment.
     
-    Args:
-        paragraph: The paragraph to format as a list item
-        level: The indentation level (0 for top-level, 1 for nested, etc.)
+    The list style is resolved once and the numbering/indent properties are
+    written into the markup, so all items are appended with a single parse.
+    With ``before``, the items are inserted just before that paragraph.
     """
-    try:
-        p = paragraph._p
-        pPr = p.get_or_add_pPr()
-        
-        # Remove any existing numbering
-        for numPr in pPr.xpath('.//w:numPr'):
-            pPr.remove(numPr)
-        
-        # Create new numbering properties
-        numPr = OxmlElement('w:numPr')
-        
-        # Set indentation level
-        ilvl = OxmlElement('w:ilvl')
-        ilvl.set(qn('w:val'), str(min(level, 8)))  # Max 8 levels deep
-        
-        # Set numbering ID (1 for bullet, 2 for numbered)
-        numId = OxmlElement('w:numId')
-        numId.set(qn('w:val'), '1')  # 1 for bullet, 2 for numbered
-        
-        # Build the numbering properties
-        numPr.append(ilvl)
-        numPr.append(numId)
-        
-        # Add to paragraph properties
-        pPr.append(numPr)
-        
-        # Set proper indentation
-        pPr_ind = pPr.get_or_add_ind()
-        pPr_ind.left = qn('w:left')
-        pPr_ind.left = str(int(level * 720))  # 720 twips = 0.5"
-        pPr_ind.hanging = qn('w:hanging')
-        pPr_ind.hanging = '360'  # 360 twips = 0.25"
-        
-    except Exception as e:
-        logger.warning(f"Error setting list style: {e}")
-        # Fallback: Just add a bullet character
-        if paragraph.text and not paragraph.text.startswith('•'):
-            paragraph.text = '• ' + paragraph.text
+    if not items:
+        return
+    style = get_or_create_style(doc, style_name)
+    style_id = doc.part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH) if style is not None else None
+    p_style = f'<w:pStyle w:val="{xml_attr(style_id)}"/>' if style_id else ''
+    # Empty items stay unstyled but keep their numbering
+    append_body_xml(doc, ''.join(
+        f'<w:p><w:pPr>{p_style}{_LIST_PROPS_XML}</w:pPr><w:r>{xml_run_content(item)}</w:r></w:p>'
+        if item and str(item).strip() else f'<w:p><w:pPr>{_LIST_PROPS_XML}</w:pPr></w:p>'
+        for item in items
+    ), before)
@@ -1,6 +1,9 @@
 import re
+import copy
+import json
 import logging
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Iterable, List, Dict, Optional, Tuple
 
 from ..models.tailored_data import (
     TailoredResumeData,
@@ -9,42 +12,365 @@ from ..models.tailored_data import (
 
 logger = logging.getLogger("tailor")
 
+_JSON_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+def _compile_sections(*patterns: str):
+    return tuple(re.compile(p, re.DOTALL | re.IGNORECASE) for p in patterns)
+
+# Section header patterns for the regex fallback parsers, compiled once at import
+_SUMMARY_PATTERNS = _compile_sections(
+    r"##\s*SUMMARY\s*##(.*?)(?=##|$)",
+    r"##\s*PROFESSIONAL[ _]?SUMMARY(.*?)(?=##|$)",
+    r"##\s*ABOUT[ _]?ME(.*?)(?=##|$)",
+    r"SUMMARY[\s\S]*?\n\s*([\s\S]*?)(?=\n##|$)"
+)
+_EXPERIENCE_PATTERNS = _compile_sections(
+    r"##\s*PROFESSIONAL[ _]?EXPERIENCE\s*##(.*?)(?=##|$)",
+    r"##\s*WORK[ _]?EXPERIENCE\s*##(.*?)(?=##|$)",
+    r"##\s*EXPERIENCE(.*?)(?=##\s*\w|$)",
+    r"##\s*WORK[\s\S]*?(?=##\s*\w|$)"
+)
+_PROJECT_PATTERNS = _compile_sections(
+    r"##\s*PROJECTS\s*##(.*?)(?=##|$)",
+    r"##\s*PROJECTS(.*?)(?=##\s*\w|$)",
+    r"##\s*SELECTED[ _]?PROJECTS(.*?)(?=##|$)"
+)
+_SKILLS_PATTERNS = _compile_sections(
+    r"##\s*TECHNICAL[ _]?SKILLS\s*##(.*?)(?=##|$)",
+    r"##\s*SKILLS[\s\S]*?\n(.*?)(?=##|$)",
+    r"##\s*TECHNICAL[ _]?SKILLS[\s\S]*?\n(.*?)(?=##|$)",
+    r"##\s*SKILLS\s*\n(.*?)(?=##\s*\w|$)"
+)
+_EDUCATION_PATTERNS = _compile_sections(
+    r"##\s*EDUCATION\s*##(.*?)(?=##|$)",
+    r"##\s*EDUCATION(.*?)(?=##\s*\w|$)",
+    r"##\s*EDUCATION[\s\S]*?(?=##\s*\w|$)"
+)
+_RESEARCH_PATTERNS = _compile_sections(
+    r"##\s*RESEARCH[ _]?PUBLICATIONS\s*##(.*?)(?=##|$)",
+    r"##\s*PUBLICATIONS\s*##(.*?)(?=##|$)",
+    r"##\s*RESEARCH[\s\S]*?(?=##\s*\w|$)",
+    r"##\s*PUBLICATIONS[\s\S]*?(?=##\s*\w|$)",
+    r"##\s*PUBLICATIONS[\s\S]*?\n(.*?)(?=##|$)"
+)
+
+# Entry, bullet and separator patterns used by the section parsers
+_NUMBERED_ITEM = re.compile(r'^\d+\.')
+_BLANK_LINE_SPLIT = re.compile(r'\n\s*\n')
+_CATEGORY_LINE = re.compile(r'^\*?([^:]+):?$', re.IGNORECASE)
+_SUBHEADER_LINE = re.compile(r'^###?\s*(.+?)\s*$')
+# Single-character skill separators, split with str methods rather than re.split
+_SKILL_SEPARATORS = ',|'
+_SKILL_SEPARATORS_DOT = ',|.'
+_LEADING_HEADER = re.compile(r'^.*?##\s*[^\n]*\n', re.IGNORECASE)
+_SKILLS_FALLBACK_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?i)##\s*(?:TECHNICAL[ _]?SKILLS|SKILLS)[\s\S]*?(?=##\s*\w|$)',
+    r'(?i)##\s*SKILLS[\s\S]*?(?=##\s*\w|$)',
+    r'(?i)SKILLS:[\s\S]*?(?=##\s*\w|$)'
+))
+# Substring keyword sets matched in one scan of the text
+_DATE_HINT = re.compile(
+    r'present|20|19|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec', re.IGNORECASE
+)
+_EDU_DETAIL_HINT = re.compile(r'gpa|grade|honor|distinction|thesis', re.IGNORECASE)
+_DATE_RANGE_LINE = re.compile(r'^(?:[A-Za-z]{3,9}\s+\d{4}\s*[-–]\s*)?(?:[A-Za-z]{3,9}\s+\d{4}|Present|Current)$')
+_LOCATION_LINE = re.compile(r'^[A-Z][a-z]+(?:[\s,][A-Z][a-z]+)*(?:,\s*[A-Z]{2})?$')
+
+# Lines that start a new publication entry, tried as one alternation per line
+_PUB_START = re.compile('|'.join(f'(?:{p})' for p in (
+    r'^\d+\.',  # Numbered entries (1., 2., etc.)
+    r'^[\-•*]',  # Bullet points
+    r'^\[\d+\]',  # Citation style [1], [2], etc.
+    r'^[A-Z][a-z]+(?:, [A-Z]\.)+',  # Author names (e.g., "Smith, J., Johnson, A.")
+    r'^[A-Z][a-z]+(?: et\.? al\.?)?\s*\d{4}[a-z]?',  # Author-year format (e.g., "Smith et al. 2020")
+)))
+_PUB_TITLE = re.compile(r'"([^"]+)"|\b([A-Z][^.!?]+\.?)(?=\s+[A-Z][a-z]+\s*\()')
+_PUB_AUTHORS = re.compile(r'^([^"\(]+)(?=\s*"|\s*\()')
+_PUB_AUTHOR_SPLIT = re.compile(r',|\band\b')
+_PUB_VENUE = re.compile(r'\(([^)]+)\)|\bin\s+([^,.]+)')
+_PUB_YEAR = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_PUB_DOI = re.compile(r'\b(?:doi|DOI):?\s*([^\s,;)]+)')
+_PUB_URL = re.compile(r'\b(?:https?://|www\.)\S+')
+
+# Common technical skills looked for in the raw resume text
+_COMMON_SKILLS_BY_CATEGORY = {
+    'Programming Languages': ['Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin'],
+    'Web Technologies': ['HTML', 'CSS', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue.js', 'Node.js', 'Django', 'Flask', 'Spring', 'ASP.NET'],
+    'Databases': ['SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'SQL Server', 'DynamoDB', 'Cassandra'],
+    'Cloud & DevOps': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform', 'Ansible', 'Jenkins', 'GitHub Actions', 'CI/CD'],
+    'Data Science': ['Python', 'R', 'Pandas', 'NumPy', 'Scikit-learn', 'TensorFlow', 'PyTorch', 'Keras', 'NLP', 'Computer Vision']
+}
+_COMMON_SKILLS = tuple(
+    (category, tuple((skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b')) for skill in skills))
+    for category, skills in _COMMON_SKILLS_BY_CATEGORY.items()
+)
+
+def _iter_section_headers(text: str, pos: int = 0, endpos: Optional[int] = None):
+    """Yield (offset, name) for each top-level "## NAME" header line.
+    
+    Only lines starting with "##" are looked at, found with str.find, so
+    the scan never runs the regex engine over section bodies. ``pos`` must
+    be the start of a line. "###" entry headers are skipped, and a trailing
+    "##" (as in "## SUMMARY ##") is dropped from the name.
+    """
+    if endpos is None:
+        endpos = len(text)
+    # "find(...) + 1 or -1" is the offset after the newline, or -1 when none is left
+    start = pos
+    if not text.startswith("##", pos, endpos):
+        start = text.find("\n##", pos, endpos) + 1 or -1
+    while start != -1:
+        end = text.find("\n", start, endpos)
+        if end == -1:
+            end = endpos
+        rest = text[start + 2:end]
+        core = rest.rstrip(" \t").rstrip("#")
+        if rest and not rest.startswith("#") and "#" not in core:
+            yield start, core.strip(" \t")
+        start = text.find("\n##", end, endpos) + 1 or -1
+
+def _split_sections(response: str) -> Dict[str, str]:
+    """Slice the response into sections with a single scan for "##" headers.
+    
+    Each slice runs from its header to the next top-level header; the first
+    header for a section wins. Sections without a header are absent, and
+    their parser then falls back to searching the whole response.
+    """
+    headers = list(_iter_section_headers(response))
+    sections: Dict[str, str] = {}
+    for i, (start, name) in enumerate(headers):
+        key = _section_key(name)
+        if key and key not in sections:
+            end = headers[i + 1][0] if i + 1 < len(headers) else len(response)
+            sections[key] = response[start:end]
+    return sections
+
 def parse_llm_response(response: str) -> TailoredResumeData:
-    """Parse comprehensive LLM response into structured data."""
+    """Parse comprehensive LLM response into structured data.
+    
+    The tailoring prompt asks for a single JSON object, which is parsed in one
+    pass; the section-by-section regex parsers are only used as a fallback
+    when the model does not return usable JSON.
+    
+    Results are memoised by response text (retries and cache hits often
+    repeat a response); each call gets its own copy, as callers mutate it.
+    """
+    return copy.deepcopy(_parse_llm_response_cached(response))
+
+@lru_cache(maxsize=256)
+def _parse_llm_response_cached(response: str) -> TailoredResumeData:
     tailored = TailoredResumeData()
 
     if not response:
         return tailored
 
-    # Parse each section
-    _parse_summary(response, tailored)
-    _parse_experience(response, tailored)
-    _parse_projects(response, tailored)
-    _parse_skills(response, tailored)
-    _parse_education(response, tailored)
-    _parse_research_publications(response, tailored)
+    data = _tolerant_json_load(response)
+    if data is not None:
+        tailored = _tailored_from_json(data)
+        if not tailored.is_empty():
+            logger.info("Parsed tailored content from JSON response")
+            return tailored
+        tailored = TailoredResumeData()
+    if _is_json_response(response):
+        # A JSON answer the loader could not recover; the "##" patterns would
+        # only match its keys (e.g. "summary") and yield JSON text as content
+        return tailored
+
+    # Parse each section from its own slice rather than rescanning the whole response
+    sections = _split_sections(response)
+    for key, parse in _SECTION_PARSERS:
+        parse(sections.get(key, response), tailored)
 
     return tailored
 
+def parse_llm_responses(responses: Iterable[str]) -> List[TailoredResumeData]:
+    """Parse several LLM responses, e.g. a batch of cached tailoring outputs.
+    
+    Each result is exactly what parse_llm_response returns for that response;
+    one summary line is logged for the whole batch. Batches are small (one
+    tailoring batch of cache hits), so they are parsed in this process.
+    """
+    results = [parse_llm_response(response) for response in responses]
+    if results:
+        parsed = sum(not tailored.is_empty() for tailored in results)
+        logger.info(f"Parsed {parsed}/{len(results)} LLM responses")
+    return results
+
+def _is_json_response(response: str) -> bool:
+    """True when the response (after any markdown fence) is a JSON object, complete or not."""
+    return _JSON_FENCE.sub("", response.strip()).startswith("{")
+
+def _tolerant_json_load(response: str) -> Optional[dict]:
+    """Extract the JSON object from an LLM response, tolerating common slips.
+    
+    Handles markdown fences, chatter before/after the object, trailing
+    commas and an object cut off by the token limit, which is closed after
+    its last complete value. Returns None if no JSON object can be recovered.
+    """
+    text = _JSON_FENCE.sub("", response.strip())
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1:
+        return None
+    candidates = [text[start:end + 1]] if end > start else []
+    candidates += [_TRAILING_COMMA.sub(r"\1", c) for c in candidates]
+    if text.startswith("{"):
+        closed = _close_truncated_json(text)
+        if closed is not None:
+            candidates.append(closed)
+    
+    for candidate in candidates:
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        return data if isinstance(data, dict) else None
+    
+    logger.debug("LLM response is not valid JSON; falling back to section parsing")
+    return None
+
+def _close_truncated_json(text: str) -> Optional[str]:
+    """Cut ``text`` back to its last complete value and close the open brackets.
+    
+    Truncation points are after an opening bracket, after a closing bracket
+    and before a comma, so a half-written string or a key without its value
+    is dropped. Returns None when the object was already closed.
+    """
+    stack: List[str] = []
+    in_string = escaped = False
+    cut: Optional[Tuple[int, Tuple[str, ...]]] = None
+    for i, c in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+            cut = (i + 1, tuple(stack))
+        elif c in "}]":
+            if not stack:
+                return None
+            stack.pop()
+            if not stack:
+                return None
+            cut = (i + 1, tuple(stack))
+        elif c == ",":
+            cut = (i, tuple(stack))
+    if cut is None:
+        return None
+    end, open_brackets = cut
+    return text[:end] + "".join(reversed(open_brackets))
+
+def _as_list(value) -> List[str]:
+    """Normalize a JSON string-or-list field to a list of non-empty strings."""
+    if isinstance(value, str):
+        value = value.split("\n")
+    if not isinstance(value, list):
+        return []
+    return [str(v).strip() for v in value if str(v).strip()]
+
+def _tailored_from_json(data: dict) -> TailoredResumeData:
+    """Build TailoredResumeData from the JSON object requested by TAILOR_PROMPT.
+    
+    Entries are stored as plain dicts/strings in the same shapes the regex
+    parsers produce, so the template update code handles both paths.
+    """
+    tailored = TailoredResumeData()
+    
+    summary = data.get("summary")
+    if isinstance(summary, str):
+        tailored.summary = summary.strip()
+    
+    for exp in data.get("experience") or []:
+        if not isinstance(exp, dict):
+            continue
+        experience = {
+            "title": str(exp.get("title") or "").strip(),
+            "company": str(exp.get("company") or "").strip(),
+            "location": str(exp.get("location") or "").strip(),
+            "dates": str(exp.get("dates") or "").strip(),
+            "bullets": _as_list(exp.get("bullets")),
+        }
+        if experience["title"] or experience["company"] or experience["bullets"]:
+            tailored.experience.append(experience)
+    
+    for proj in data.get("projects") or []:
+        if not isinstance(proj, dict):
+            continue
+        project = {
+            "name": str(proj.get("name") or "").strip(),
+            "description": str(proj.get("description") or "").strip(),
+            "achievements": _as_list(proj.get("achievements")),
+            "technologies": _as_list(proj.get("technologies")),
+        }
+        if project["description"] or project["achievements"]:
+            tailored.projects.append(project)
+    
+    skills = data.get("skills") or data.get("technical_skills")
+    if isinstance(skills, dict):
+        tailored.technical_skills = {
+            str(category): _as_list(values)
+            for category, values in skills.items()
+            if _as_list(values)
+        }
+    elif isinstance(skills, list) and _as_list(skills):
+        tailored.technical_skills = {"Technical Skills": _as_list(skills)}
+    
+    for edu in data.get("education") or []:
+        if isinstance(edu, dict):
+            tailored.education.append({
+                "degree": str(edu.get("degree") or "").strip(),
+                "school": str(edu.get("school") or edu.get("institution") or "").strip(),
+                "location": str(edu.get("location") or "").strip(),
+                "date": str(edu.get("date") or edu.get("dates") or "").strip(),
+                "details": _as_list(edu.get("details")),
+            })
+        elif isinstance(edu, str) and edu.strip():
+            tailored.education.append(edu.strip())
+    
+    tailored.research_publications = _as_list(data.get("research_publications"))
+    
+    return tailored
+
+def _strip_bullet(line: str, marks: str = '-•*.') -> str:
+    """Drop one leading bullet mark or digit and the whitespace after it.
+    
+    A prefix check rather than a regex substitution; same result as
+    ``re.sub(r'^[<marks>\\d]\\s*', '', line)``.
+    """
+    if line and (line[0] in marks or line[0].isdecimal()):
+        return line[1:].lstrip()
+    return line
+
+def _stripped_lines(text: str) -> List[str]:
+    """Non-empty lines of ``text``, each stripped once."""
+    return [stripped for line in text.split("\n") if (stripped := line.strip())]
+
+def _section_body(match: re.Match) -> str:
+    """Body of a matched section: its capture group, or everything after the header line.
+    
+    Some section patterns only mark where the section ends and have no group.
+    """
+    if match.re.groups:
+        return match.group(1)
+    return match.group(0).partition('\n')[2]
+
 def _parse_summary(response: str, tailored: TailoredResumeData) -> None:
     """Parse summary section from LLM response with improved pattern matching."""
-    summary_patterns = [
-        r"##\s*SUMMARY\s*##(.*?)(?=##|$)",
-        r"##\s*PROFESSIONAL[ _]?SUMMARY(.*?)(?=##|$)",
-        r"##\s*ABOUT[ _]?ME(.*?)(?=##|$)",
-        r"SUMMARY[\s\S]*?\n\s*([\s\S]*?)(?=\n##|$)"
-    ]
-    
-    for pattern in summary_patterns:
-        summary_match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+    for pattern in _SUMMARY_PATTERNS:
+        summary_match = pattern.search(response)
         if summary_match:
-            summary_text = summary_match.group(1).strip()
+            summary_text = _section_body(summary_match).strip()
             if summary_text:
                 # Clean up the summary text
                 summary_lines = [
-                    line.strip() 
-                    for line in summary_text.split('\n') 
-                    if line.strip() and not line.strip().startswith('#')
+                    line for line in _stripped_lines(summary_text)
+                    if not line.startswith('#')
                 ]
                 tailored.summary = '\n'.join(summary_lines)
                 logger.info("Successfully parsed summary section")
@@ -55,18 +381,11 @@ def _parse_summary(response: str, tailored: TailoredResumeData) -> None:
 def _parse_experience(response: str, tailored: TailoredResumeData) -> None:
     """Parse experience section from LLM response with improved parsing."""
     # Try multiple possible section headers
-    exp_patterns = [
-        r"##\s*PROFESSIONAL[ _]?EXPERIENCE\s*##(.*?)(?=##|$)",
-        r"##\s*WORK[ _]?EXPERIENCE\s*##(.*?)(?=##|$)",
-        r"##\s*EXPERIENCE(.*?)(?=##\s*\w|$)",
-        r"##\s*WORK[\s\S]*?(?=##\s*\w|$)"
-    ]
-    
     exp_text = ""
-    for pattern in exp_patterns:
-        exp_match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+    for pattern in _EXPERIENCE_PATTERNS:
+        exp_match = pattern.search(response)
         if exp_match:
-            exp_text = exp_match.group(1).strip()
+            exp_text = _section_body(exp_match).strip()
             if exp_text:
                 break
     
@@ -75,13 +394,13 @@ def _parse_experience(response: str, tailored: TailoredResumeData) -> None:
         return
     
     # Split into individual job entries
-    job_entries = re.split(r"###\s*", exp_text)
+    job_entries = exp_text.split("###")
     
     for entry in job_entries:
         if not entry.strip():
             continue
             
-        lines = [line.strip() for line in entry.split("\n") if line.strip()]
+        lines = _stripped_lines(entry)
         if not lines:
             continue
             
@@ -101,7 +420,7 @@ def _parse_experience(response: str, tailored: TailoredResumeData) -> None:
                     location = parts[2]
             elif len(parts) == 2:
                 # Could be "Title | Company" or "Company | Dates"
-                if any(x in parts[1].lower() for x in ['present', '20', '19', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
+                if _DATE_HINT.search(parts[1]):
                     title = parts[0]
                     dates = parts[1]
                 else:
@@ -119,24 +438,23 @@ def _parse_experience(response: str, tailored: TailoredResumeData) -> None:
         
         # Parse bullet points and responsibilities
         bullets = []
-        current_bullet = ""
+        # Lines of the bullet being built, joined once when it is complete
+        current_parts: List[str] = []
         
         for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check for bullet points
-            if line.startswith(("-", "•", "*")) or re.match(r'^\d+\.', line):
+            # Check for bullet points; the regex only runs on lines starting with a digit
+            if line.startswith(("-", "•", "*")) or (line[:1].isdigit() and _NUMBERED_ITEM.match(line)):
                 # Save previous bullet if exists
+                current_bullet = " ".join(current_parts)
                 if current_bullet:
                     bullets.append(current_bullet.strip())
-                current_bullet = re.sub(r'^[\-•*\d\.]\s*', '', line)
+                current_parts = [_strip_bullet(line)]
             else:
                 # Continue the current bullet point
-                current_bullet += " " + line
+                current_parts.append(line)
         
         # Add the last bullet point
+        current_bullet = " ".join(current_parts)
         if current_bullet:
             bullets.append(current_bullet.strip())
         
@@ -158,17 +476,11 @@ def _parse_experience(response: str, tailored: TailoredResumeData) -> None:
 def _parse_projects(response: str, tailored: TailoredResumeData) -> None:
     """Parse projects section from LLM response with improved parsing."""
     # Try multiple possible section headers
-    project_patterns = [
-        r"##\s*PROJECTS\s*##(.*?)(?=##|$)",
-        r"##\s*PROJECTS(.*?)(?=##\s*\w|$)",
-        r"##\s*SELECTED[ _]?PROJECTS(.*?)(?=##|$)"
-    ]
-    
     proj_text = ""
-    for pattern in project_patterns:
-        proj_match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+    for pattern in _PROJECT_PATTERNS:
+        proj_match = pattern.search(response)
         if proj_match:
-            proj_text = proj_match.group(1).strip()
+            proj_text = _section_body(proj_match).strip()
             if proj_text:
                 break
     
@@ -177,13 +489,13 @@ def _parse_projects(response: str, tailored: TailoredResumeData) -> None:
         return
     
     # Split into individual projects
-    project_entries = re.split(r"###\s*", proj_text)
+    project_entries = proj_text.split("###")
     
     for entry in project_entries:
         if not entry.strip():
             continue
             
-        lines = [line.strip() for line in entry.split("\n") if line.strip()]
+        lines = _stripped_lines(entry)
         if not lines:
             continue
             
@@ -198,7 +510,7 @@ def _parse_projects(response: str, tailored: TailoredResumeData) -> None:
             project_name = parts[0].strip()
             if len(parts) > 1 and ":" in parts[1]:
                 tech_part = parts[1].split(":", 1)[1].strip()
-                technologies = [t.strip() for t in re.split(r'[,\s]+', tech_part) if t.strip()]
+                technologies = tech_part.replace(',', ' ').split()
         
         # Parse project description and achievements
         description = []
@@ -206,10 +518,6 @@ def _parse_projects(response: str, tailored: TailoredResumeData) -> None:
         current_section = None
         
         for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
-                
             # Check for section headers in the project
             if line.lower().startswith(("challenge:", "action:", "result:", "achievements:")):
                 current_section = line.split(":")[0].strip().lower()
@@ -218,7 +526,7 @@ def _parse_projects(response: str, tailored: TailoredResumeData) -> None:
                     continue
             
             # Clean up bullet points
-            line = re.sub(r'^[•\-\*\d\.]\s*', '', line)
+            line = _strip_bullet(line)
             
             if current_section == "achievements" or line.startswith(("-", "•", "*")):
                 achievements.append(line)
@@ -244,18 +552,11 @@ def _parse_skills(response: str, tailored: TailoredResumeData) -> None:
     skills_dict = {}
     
     # Try multiple possible section headers
-    skills_patterns = [
-        r"##\s*TECHNICAL[ _]?SKILLS\s*##(.*?)(?=##|$)",
-        r"##\s*SKILLS[\s\S]*?\n(.*?)(?=##|$)",
-        r"##\s*TECHNICAL[ _]?SKILLS[\s\S]*?\n(.*?)(?=##|$)",
-        r"##\s*SKILLS\s*\n(.*?)(?=##\s*\w|$)"
-    ]
-    
     skills_text = ""
-    for pattern in skills_patterns:
-        skills_match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+    for pattern in _SKILLS_PATTERNS:
+        skills_match = pattern.search(response)
         if skills_match:
-            skills_text = skills_match.group(1).strip()
+            skills_text = _section_body(skills_match).strip()
             if skills_text:
                 break
     
@@ -264,15 +565,15 @@ def _parse_skills(response: str, tailored: TailoredResumeData) -> None:
         return
     
     # Try structured parsing first (categories with skills)
-    category_blocks = re.split(r'\n\s*\n', skills_text.strip())
+    category_blocks = _BLANK_LINE_SPLIT.split(skills_text.strip())
     
     for block in category_blocks:
-        lines = [line.strip() for line in block.split('\n') if line.strip()]
+        lines = _stripped_lines(block)
         if not lines:
             continue
             
         # Check if this is a category header
-        category_match = re.match(r'^\*?([^:]+):?$', lines[0], re.IGNORECASE)
+        category_match = _CATEGORY_LINE.match(lines[0])
         if category_match:
             category = category_match.group(1).strip().title()
             skills = []
@@ -280,8 +581,7 @@ def _parse_skills(response: str, tailored: TailoredResumeData) -> None:
             # Parse skills in this category
             for line in lines[1:]:
                 # Split by commas, semicolons, or other separators
-                line_skills = re.split(r'[,;]|\s+', line)
-                skills.extend([s.strip() for s in line_skills if s.strip()])
+                skills.extend(line.replace(',', ' ').replace(';', ' ').split())
             
             if category and skills:
                 skills_dict[category] = skills
@@ -295,9 +595,8 @@ def _parse_skills(response: str, tailored: TailoredResumeData) -> None:
                 continue
                 
             # Clean up the line and split into skills
-            line = re.sub(r'^[\-•*\d\.]\s*', '', line)  # Remove bullets/numbers
-            line_skills = re.split(r'[,;]|\s+', line)
-            all_skills.extend([s.strip() for s in line_skills if s.strip()])
+            line = _strip_bullet(line)  # Remove bullets/numbers
+            all_skills.extend(line.replace(',', ' ').replace(';', ' ').split())
         
         if all_skills:
             skills_dict["Technical Skills"] = all_skills
@@ -309,16 +608,31 @@ def _parse_skills(response: str, tailored: TailoredResumeData) -> None:
     else:
         logger.warning("No skills could be parsed from the response")
 
+def _split_skills(text: str, separators: str) -> List[str]:
+    """Split on any character in ``separators``, stripping each piece once and dropping empty ones."""
+    first = separators[0]
+    for sep in separators[1:]:
+        text = text.replace(sep, first)
+    return [stripped for part in text.split(first) if (stripped := part.strip())]
+
+def _dedupe_skills(skills_dict: Dict[str, List[str]]) -> None:
+    """Drop empty categories and repeated skills, keeping first-seen order."""
+    for category, skills in list(skills_dict.items()):
+        if skills:
+            skills_dict[category] = list(dict.fromkeys(skills))
+        else:
+            del skills_dict[category]
+
 def _process_skills_text(skills_text: str, skills_dict: Dict[str, List[str]]) -> None:
     """Process skills text and populate skills dictionary with improved parsing."""
     current_category = "Technical Skills"  # Default category
     
     # Split into lines and clean them up
-    lines = [line.strip() for line in skills_text.split('\n') if line.strip()]
+    lines = _stripped_lines(skills_text)
     
     for line in lines:
         # Check for category headers (starts with ### or is in all caps)
-        category_match = re.match(r'^###?\s*(.+?)\s*$', line)
+        category_match = _SUBHEADER_LINE.match(line) if line.startswith("##") else None
         if category_match or (line.isupper() and len(line) < 50):  # Likely a category header
             current_category = category_match.group(1).strip() if category_match else line.strip(':# ')
             if current_category.lower() in ['skills', 'technical skills']:
@@ -340,43 +654,28 @@ def _process_skills_text(skills_text: str, skills_dict: Dict[str, List[str]]) ->
                 if category and skills_part.strip():
                     if category not in skills_dict:
                         skills_dict[category] = []
-                    skills = [s.strip() for s in re.split(r'[,\|]', skills_part) if s.strip()]
-                    skills_dict[category].extend(skills)
+                    skills_dict[category].extend(_split_skills(skills_part, _SKILL_SEPARATORS))
             else:
                 # Regular skill line
                 if current_category not in skills_dict:
                     skills_dict[current_category] = []
-                skills = [s.strip() for s in re.split(r'[,\|]', line) if s.strip()]
-                skills_dict[current_category].extend(skills)
+                skills_dict[current_category].extend(_split_skills(line, _SKILL_SEPARATORS))
     
     # Clean up skills - remove duplicates and empty categories
-    for category in list(skills_dict.keys()):
-        if not skills_dict[category]:
-            del skills_dict[category]
-        else:
-            # Remove duplicates while preserving order
-            seen = set()
-            skills_dict[category] = [x for x in skills_dict[category] 
-                                   if not (x in seen or seen.add(x))]
+    _dedupe_skills(skills_dict)
 
 def _fallback_skills_parsing(response: str, skills_dict: Dict[str, List[str]]) -> None:
     """Fallback method for parsing skills when structured parsing fails."""
     logger.debug("Trying fallback skills parsing...")
     
     # Try multiple patterns to find the skills section
-    patterns = [
-        r'(?i)##\s*(?:TECHNICAL[ _]?SKILLS|SKILLS)[\s\S]*?(?=##\s*\w|$)',
-        r'(?i)##\s*SKILLS[\s\S]*?(?=##\s*\w|$)',
-        r'(?i)SKILLS:[\s\S]*?(?=##\s*\w|$)'
-    ]
-    
     skills_text = ""
-    for pattern in patterns:
-        match = re.search(pattern, response, re.IGNORECASE)
+    for pattern in _SKILLS_FALLBACK_PATTERNS:
+        match = pattern.search(response)
         if match:
             skills_text = match.group(0)
             # Remove the header
-            skills_text = re.sub(r'^.*?##\s*[^\n]*\n', '', skills_text, flags=re.IGNORECASE)
+            skills_text = _LEADING_HEADER.sub('', skills_text)
             if skills_text.strip():
                 break
     
@@ -403,8 +702,7 @@ def _fallback_skills_parsing(response: str, skills_dict: Dict[str, List[str]]) -
                 if current_category not in skills_dict:
                     skills_dict[current_category] = []
                 # Add skills after the colon if any
-                skills = [s.strip() for s in re.split(r'[,\|\.]', parts[1]) if s.strip()]
-                skills_dict[current_category].extend(skills)
+                skills_dict[current_category].extend(_split_skills(parts[1], _SKILL_SEPARATORS_DOT))
                 continue
         
         # Regular skill line
@@ -412,18 +710,11 @@ def _fallback_skills_parsing(response: str, skills_dict: Dict[str, List[str]]) -
             skills_dict[current_category] = []
             
         # Clean up the line and split into skills
-        line = re.sub(r'^[•\-\*\d\.]\s*', '', line)  # Remove bullet points
-        skills = [s.strip() for s in re.split(r'[,\|\.]', line) if s.strip()]
-        skills_dict[current_category].extend(skills)
+        line = _strip_bullet(line)  # Remove bullet points
+        skills_dict[current_category].extend(_split_skills(line, _SKILL_SEPARATORS_DOT))
     
     # Clean up empty categories and remove duplicates
-    for category in list(skills_dict.keys()):
-        if not skills_dict[category]:
-            del skills_dict[category]
-        else:
-            seen = set()
-            skills_dict[category] = [x for x in skills_dict[category] 
-                                   if not (x in seen or seen.add(x))]
+    _dedupe_skills(skills_dict)
     
     if skills_dict:
         logger.info(f"Extracted {sum(len(v) for v in skills_dict.values())} skills using fallback parser")
@@ -433,23 +724,14 @@ def _extract_skills_from_raw_text(tailored: TailoredResumeData) -> None:
     if not hasattr(tailored, 'raw_text') or not tailored.raw_text:
         return
     
-    # Common technical skills to look for
-    common_skills = {
-        'Programming Languages': ['Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin'],
-        'Web Technologies': ['HTML', 'CSS', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue.js', 'Node.js', 'Django', 'Flask', 'Spring', 'ASP.NET'],
-        'Databases': ['SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle', 'SQL Server', 'DynamoDB', 'Cassandra'],
-        'Cloud & DevOps': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform', 'Ansible', 'Jenkins', 'GitHub Actions', 'CI/CD'],
-        'Data Science': ['Python', 'R', 'Pandas', 'NumPy', 'Scikit-learn', 'TensorFlow', 'PyTorch', 'Keras', 'NLP', 'Computer Vision']
-    }
-    
     skills_found = {}
     text_lower = tailored.raw_text.lower()
     
-    for category, skills in common_skills.items():
+    for category, skills in _COMMON_SKILLS:
         found = []
-        for skill in skills:
+        for skill, pattern in skills:
             # Look for exact matches (case insensitive)
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
+            if pattern.search(text_lower):
                 found.append(skill)
         if found:
             skills_found[category] = found
@@ -462,17 +744,11 @@ def _extract_skills_from_raw_text(tailored: TailoredResumeData) -> None:
 def _parse_education(response: str, tailored: TailoredResumeData) -> None:
     """Parse education section from LLM response with improved parsing."""
     # Try multiple possible section headers
-    edu_patterns = [
-        r"##\s*EDUCATION\s*##(.*?)(?=##|$)",
-        r"##\s*EDUCATION(.*?)(?=##\s*\w|$)",
-        r"##\s*EDUCATION[\s\S]*?(?=##\s*\w|$)"
-    ]
-    
     edu_text = ""
-    for pattern in edu_patterns:
-        edu_match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+    for pattern in _EDUCATION_PATTERNS:
+        edu_match = pattern.search(response)
         if edu_match:
-            edu_text = edu_match.group(1).strip()
+            edu_text = _section_body(edu_match).strip()
             if edu_text:
                 break
     
@@ -500,7 +776,7 @@ def _parse_education(response: str, tailored: TailoredResumeData) -> None:
                 current_entry = {}
                 
             # Parse degree line
-            parts = [p.strip() for p in re.split(r'[\|\-]', line)]
+            parts = [p.strip() for p in line.replace('-', '|').split('|')]
             if len(parts) >= 1:
                 current_entry['degree'] = parts[0]
             if len(parts) >= 2:
@@ -508,13 +784,13 @@ def _parse_education(response: str, tailored: TailoredResumeData) -> None:
             if len(parts) >= 3:
                 current_entry['date'] = parts[2]
         # Check for date range (e.g., "Sep 2015 - May 2019")
-        elif re.match(r'^(?:[A-Za-z]{3,9}\s+\d{4}\s*[-–]\s*)?(?:[A-Za-z]{3,9}\s+\d{4}|Present|Current)$', line):
+        elif _DATE_RANGE_LINE.match(line):
             current_entry['date'] = line
         # Check for location
-        elif re.match(r'^[A-Z][a-z]+(?:[\s,][A-Z][a-z]+)*(?:,\s*[A-Z]{2})?$', line):
+        elif _LOCATION_LINE.match(line):
             current_entry['location'] = line
         # Check for GPA or honors
-        elif any(x in line.lower() for x in ['gpa', 'grade', 'honor', 'distinction', 'thesis']):
+        elif _EDU_DETAIL_HINT.search(line):
             current_entry['details'] = current_entry.get('details', []) + [line]
         # Bullet points (achievements, coursework, etc.)
         elif line.startswith(('-', '•', '*')):
@@ -546,19 +822,11 @@ def _parse_education(response: str, tailored: TailoredResumeData) -> None:
 def _parse_research_publications(response: str, tailored: TailoredResumeData) -> None:
     """Parse research publications section from LLM response with improved parsing."""
     # Try multiple possible section headers
-    research_patterns = [
-        r"##\s*RESEARCH[ _]?PUBLICATIONS\s*##(.*?)(?=##|$)",
-        r"##\s*PUBLICATIONS\s*##(.*?)(?=##|$)",
-        r"##\s*RESEARCH[\s\S]*?(?=##\s*\w|$)",
-        r"##\s*PUBLICATIONS[\s\S]*?(?=##\s*\w|$)",
-        r"##\s*PUBLICATIONS[\s\S]*?\n(.*?)(?=##|$)"
-    ]
-    
     research_text = ""
-    for pattern in research_patterns:
-        research_match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
+    for pattern in _RESEARCH_PATTERNS:
+        research_match = pattern.search(response)
         if research_match:
-            research_text = research_match.group(1).strip()
+            research_text = _section_body(research_match).strip()
             if research_text:
                 break
     
@@ -570,26 +838,13 @@ def _parse_research_publications(response: str, tailored: TailoredResumeData) ->
     publications = []
     current_pub = []
     
-    # Common patterns for publication entries
-    pub_start_patterns = [
-        r'^\d+\.',  # Numbered entries (1., 2., etc.)
-        r'^[\-•*]',  # Bullet points
-        r'^\[\d+\]',  # Citation style [1], [2], etc.
-        r'^[A-Z][a-z]+(?:, [A-Z]\.)+',  # Author names (e.g., "Smith, J., Johnson, A.")
-        r'^[A-Z][a-z]+(?: et\.? al\.?)?\s*\d{4}[a-z]?',  # Author-year format (e.g., "Smith et al. 2020")
-    ]
-    
     for line in research_text.split('\n'):
         line = line.strip()
         if not line or line.startswith(('##', '###')):
             continue
         
         # Check if this line starts a new publication
-        is_new_pub = False
-        for pattern in pub_start_patterns:
-            if re.search(pattern, line):
-                is_new_pub = True
-                break
+        is_new_pub = _PUB_START.match(line) is not None
         
         # If it's a new publication, save the previous one
         if is_new_pub and current_pub:
@@ -601,7 +856,7 @@ def _parse_research_publications(response: str, tailored: TailoredResumeData) ->
             current_pub = []
         
         # Clean up the line and add to current publication
-        line = re.sub(r'^[\d\-•*]\s*', '', line)  # Remove numbering/bullets
+        line = _strip_bullet(line, marks='-•*')  # Remove numbering/bullets
         current_pub.append(line)
     
     # Add the last publication
@@ -626,33 +881,33 @@ def _parse_publication_entry(text: str) -> Optional[PublicationEntry]:
     pub = PublicationEntry()
     
     # Try to extract title (usually in quotes or before a period)
-    title_match = re.search(r'"([^"]+)"|\b([A-Z][^.!?]+\.?)(?=\s+[A-Z][a-z]+\s*\()', text)
+    title_match = _PUB_TITLE.search(text)
     if title_match:
         pub.title = (title_match.group(1) or title_match.group(2)).strip()
     
     # Try to extract authors (before the title or in parentheses)
-    authors_match = re.search(r'^([^"\(]+)(?=\s*"|\s*\()', text)
+    authors_match = _PUB_AUTHORS.search(text)
     if authors_match:
         authors_text = authors_match.group(1).strip()
         # Split authors by commas and clean up
-        pub.authors = [a.strip() for a in re.split(r',|\band\b', authors_text) if a.strip()]
+        pub.authors = [a.strip() for a in _PUB_AUTHOR_SPLIT.split(authors_text) if a.strip()]
     
     # Try to extract publication venue (in parentheses or after "in")
-    venue_match = re.search(r'\(([^)]+)\)|\bin\s+([^,.]+)', text)
+    venue_match = _PUB_VENUE.search(text)
     if venue_match:
         pub.publication = (venue_match.group(1) or venue_match.group(2)).strip()
     
     # Try to extract year
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', text)
+    year_match = _PUB_YEAR.search(text)
     if year_match:
         pub.date = year_match.group(1)
     
     # Try to extract DOI or URL
-    doi_match = re.search(r'\b(?:doi|DOI):?\s*([^\s,;)]+)', text)
+    doi_match = _PUB_DOI.search(text)
     if doi_match:
         pub.doi = doi_match.group(1).strip()
     
-    url_match = re.search(r'\b(?:https?://|www\.)\S+', text)
+    url_match = _PUB_URL.search(text)
     if url_match and not pub.doi:
         pub.url = url_match.group(0)
     
@@ -665,3 +920,145 @@ def _parse_publication_entry(text: str) -> Optional[PublicationEntry]:
             pub.title = text
     
     return pub
+
+# Fallback section parsers in the order parse_llm_response applies them
+# One row per fallback section: (key, header keywords, parser). Header names
+# are matched against the rows in order, so "RESEARCH PUBLICATIONS" is research
+# and "WORK EXPERIENCE" is experience; adding a section is adding a row.
+_SECTIONS = (
+    ("research", ("PUBLICATION", "RESEARCH"), _parse_research_publications),
+    ("skills", ("SKILL",), _parse_skills),
+    ("experience", ("EXPERIENCE", "WORK"), _parse_experience),
+    ("projects", ("PROJECT",), _parse_projects),
+    ("education", ("EDUCATION",), _parse_education),
+    ("summary", ("SUMMARY", "ABOUT"), _parse_summary),
+)
+_SECTION_PARSERS = tuple((key, parse) for key, _, parse in _SECTIONS)
+_SECTION_PARSER_BY_KEY = dict(_SECTION_PARSERS)
+
+def _section_key(name: str) -> Optional[str]:
+    name = name.upper()
+    return next((key for key, words, _ in _SECTIONS if any(w in name for w in words)), None)
+
+class StreamingResponseParser:
+    """Parse a tailoring response while the LLM is still generating it.
+    
+    Feed each decoded chunk to ``feed``. Fallback "## SECTION" blocks are
+    parsed as soon as the next top-level header closes them, so that work
+    overlaps with decoding. ``feed`` returns True once a complete top-level
+    JSON object with usable content has arrived; the caller can then stop
+    generation instead of decoding any trailing chatter.
+    
+    If the stream runs to the end, ``finish`` returns what parse_llm_response
+    would return for the full text.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self._tailored = TailoredResumeData()
+        self._result: Optional[TailoredResumeData] = None
+        self._parsed = set()
+        # Fallback section state: next unscanned line, last header seen
+        self._scan_pos = 0
+        self._open: Optional[Tuple[Optional[str], int]] = None
+        # JSON object state
+        self._object_start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk of the response; True once the JSON object is complete."""
+        if self._result is not None:
+            return True
+        if not self.text:
+            # Match the stripped text parse_llm_response gets from generate()
+            chunk = chunk.lstrip()
+            if not chunk:
+                return False
+        offset = len(self.text)
+        self.text += chunk
+        if self._scan_json(chunk, offset):
+            return True
+        if self._object_start is None:
+            self._scan_sections()
+        return False
+    
+    def finish(self) -> TailoredResumeData:
+        """Return the parsed response once the stream has ended."""
+        if self._result is not None:
+            return self._result
+        response = self.text.rstrip()
+        if not response:
+            return TailoredResumeData()
+        
+        data = _tolerant_json_load(response)
+        if data is not None:
+            tailored = _tailored_from_json(data)
+            if not tailored.is_empty():
+                logger.info("Parsed tailored content from JSON response")
+                return tailored
+        if _is_json_response(response):
+            # Same as parse_llm_response: no "##" fallback over JSON text
+            return TailoredResumeData()
+        
+        # Sections already parsed while streaming used the same slices
+        # _split_sections would produce, so only the rest are parsed here
+        sections = _split_sections(response)
+        for key, parse in _SECTION_PARSERS:
+            if key not in self._parsed:
+                parse(sections.get(key, response), self._tailored)
+        return self._tailored
+    
+    def _scan_json(self, chunk: str, offset: int) -> bool:
+        for i, c in enumerate(chunk, offset):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif c == "\\":
+                    self._escaped = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == "{":
+                if self._depth == 0:
+                    self._object_start = i
+                self._depth += 1
+            elif self._depth == 0:
+                continue
+            elif c == '"':
+                self._in_string = True
+            elif c == "}":
+                self._depth -= 1
+                if self._depth == 0 and self._complete_object(i + 1):
+                    return True
+        return False
+    
+    def _complete_object(self, end: int) -> bool:
+        data = _tolerant_json_load(self.text[self._object_start:end])
+        self._object_start = None
+        if data is None:
+            return False
+        tailored = _tailored_from_json(data)
+        if tailored.is_empty():
+            return False
+        logger.info("Parsed tailored content from streamed JSON response")
+        self._result = tailored
+        return True
+    
+    def _scan_sections(self) -> None:
+        # Only whole lines are scanned, so a header is never matched half-decoded
+        end = self.text.rfind("\n") + 1
+        if end <= self._scan_pos:
+            return
+        for start, name in _iter_section_headers(self.text, self._scan_pos, end):
+            self._close_open_section(start)
+            self._open = (_section_key(name), start)
+        self._scan_pos = end
+    
+    def _close_open_section(self, end: int) -> None:
+        if self._open is None:
+            return
+        key, start = self._open
+        if key and key not in self._parsed:
+            self._parsed.add(key)
+            _SECTION_PARSER_BY_KEY[key](self.text[start:end], self._tailored)
@@ -1,13 +1,30 @@
 import os
 import logging
-from typing import Optional, Dict, List
+from functools import lru_cache
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Optional, Dict, List, Tuple
+import docx
 from docx import Document
 
 logger = logging.getLogger("tailor")
 
+# Profile attributes shown in contact lines, in display order
+CONTACT_FIELDS = ("email", "phone", "linkedin", "location")
+CONTACT_LABELS = {
+    "email": "Email",
+    "phone": "Phone",
+    "linkedin": "LinkedIn",
+    "location": "Location",
+}
+
+@lru_cache(maxsize=None)
 def get_template_path(template_type: str = 'resume') -> Optional[str]:
     """Get the path to a template file.
     
+    The lookup is cached per template type for the life of the process; call
+    ``get_template_path.cache_clear()`` after adding a template at runtime.
+    
     Args:
         template_type: Type of template to get ('resume' or 'cover_letter')
     """
@@ -26,7 +43,6 @@ def get_template_path(template_type: str = 'resume') -> Optional[str]:
 
     # Try to find the default template in the package
     try:
-        import docx
         package_dir = os.path.dirname(docx.__file__)
         default_template = os.path.join(package_dir, 'templates', 'default.docx')
         if os.path.exists(default_template):
@@ -36,30 +52,58 @@ def get_template_path(template_type: str = 'resume') -> Optional[str]:
 
     return None
 
+@lru_cache(maxsize=4)
+def _read_template_bytes(template_path: str, mtime: float) -> bytes:
+    # mtime is part of the key so an edited template is re-read
+    with open(template_path, 'rb') as f:
+        return f.read()
+
+def _template_mtime(template_path: Optional[str]) -> Optional[float]:
+    # One stat answers both "does it exist" and "has it changed"
+    if not template_path:
+        return None
+    try:
+        return os.path.getmtime(template_path)
+    except OSError:
+        return None
+
 def create_document(template_path: Optional[str] = None) -> Document:
-    """Create a new document, optionally based on a template."""
-    if template_path and os.path.exists(template_path):
+    """Create a new document, optionally based on a template.
+    
+    The template file is read from disk once (until it changes) and each
+    document is opened from an in-memory copy, so tailoring many resumes
+    does not re-read the .docx every time.
+    """
+    mtime = _template_mtime(template_path)
+    if mtime is not None:
         logger.info(f"Loading template from: {template_path}")
-        return Document(template_path)
+        data = _read_template_bytes(template_path, mtime)
+        return Document(BytesIO(data))
     
     logger.warning("No template found, creating new document")
     return Document()
 
 def save_document(doc: Document, output_path: str) -> str:
     """Save document to the specified path with proper error handling."""
+    temp_path = None
     try:
         # Ensure output directory exists
         output_dir = os.path.dirname(output_path)
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir, exist_ok=True, mode=0o755)
         
+        # Serialize in memory so the zip is written with one large write
+        buf = BytesIO()
+        doc.save(buf)
+        
         # Save to temp file first
         temp_path = f"{output_path}.tmp"
-        doc.save(temp_path)
+        with open(temp_path, 'wb') as f:
+            f.write(buf.getbuffer())
         
-        # Then move to final location (atomic operation)
-        import shutil
-        shutil.move(temp_path, output_path)
+        # Then move to final location (atomic rename; readers never see a partial file)
+        os.replace(temp_path, output_path)
+        temp_path = None
         os.chmod(output_path, 0o644)  # Set appropriate permissions
         
         logger.info(f"Successfully saved document to {output_path}")
@@ -69,13 +113,38 @@ def save_document(doc: Document, output_path: str) -> str:
         logger.error(f"Error saving document to {output_path}: {e}")
         raise
     finally:
-        # Clean up temp file if it exists
-        if 'temp_path' in locals() and os.path.exists(temp_path):
+        # Clean up the temp file if the save failed before the rename
+        if temp_path is not None:
             try:
                 os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
             except Exception as cleanup_error:
                 logger.error(f"Error cleaning up temp file: {cleanup_error}")
 
+def snapshot_attrs(obj, fields: Tuple[str, ...]) -> SimpleNamespace:
+    """Read each attribute of ``obj`` once; missing attributes become None."""
+    return SimpleNamespace(**{f: getattr(obj, f, None) for f in fields})
+
+def collect_contact_info(
+    profile,
+    fields: Tuple[str, ...] = CONTACT_FIELDS,
+    labeled: bool = False
+) -> List[str]:
+    """Collect the non-empty contact values of a profile.
+    
+    Args:
+        profile: Object exposing contact attributes (email, phone, ...)
+        fields: Attribute names to collect, in output order
+        labeled: Prefix each value with its label, e.g. "Email: ..."
+    """
+    if labeled:
+        return [
+            f"{CONTACT_LABELS.get(f, f.title())}: {v}"
+            for f in fields if (v := getattr(profile, f, None))
+        ]
+    return [v for f in fields if (v := getattr(profile, f, None))]
+
 def format_skills_for_template(skills_dict: Dict[str, List[str]]) -> str:
     """Format skills dictionary for template replacement."""
     if not skills_dict:
@@ -1,9 +1,13 @@
+from functools import lru_cache
 from .local_llm import LLM, get_local_llm
 from .mock_llm import MockLLM
 
 __all__ = ["get_llm", "MockLLM", "LLM"]
 
+@lru_cache(maxsize=None)
 def get_llm(mode: str = "mock"):  # Default to mock for testing
+    # One client per mode for the whole process, including the MockLLM
+    # fallback, so a failed local load is not retried on every call
     if mode == "local":
         try:
             return get_local_llm()
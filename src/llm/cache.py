@@ -0,0 +1,97 @@
+import hashlib
+import re
+import zlib
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import numpy as np
+from diskcache import Cache
+from config import cfg
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def _embed(text: str, dims: int) -> np.ndarray:
+    """Hashed bag-of-words vector, L2-normalised.
+
+    crc32 is used instead of hash() so vectors are stable across processes.
+    Reposted or lightly edited job descriptions land at cosine ~1.0.
+    """
+    vec = np.zeros(dims, dtype=np.float32)
+    for token in _TOKEN_RE.findall(text.lower()):
+        vec[zlib.crc32(token.encode()) % dims] += 1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+class SemanticLLMCache:
+    """Reuse LLM responses for a fixed prompt prefix and the same job posting.
+
+    Lookups are exact: each response is stored under its own key, the SHA-256
+    of the namespace (the backend and model that produced it), the prompt
+    prefix (instructions + resume) and the whitespace-normalised job text.
+    Switching models or changing the resume or prompt therefore misses.
+
+    With ``threshold`` set, an exact miss falls back to the most similar job
+    text cached for the same company and title, so a reposted or lightly
+    edited description is reused but another role's response never is. The
+    per-(company, title) index keeps the newest ``max_per_group`` entries, and
+    the store as a whole is capped at ``size_limit`` bytes, least recently
+    used first out.
+
+    The raw response string is stored, not the parsed result, so parsing
+    still runs on every hit and parser changes take effect immediately.
+    """
+
+    def __init__(self, directory: str = "output/.llm_cache", threshold: Optional[float] = None,
+                 dims: int = 2048, namespace: str = "", max_per_group: int = 16,
+                 size_limit: int = 256 * 2**20):
+        self.cache = Cache(directory, size_limit=size_limit, eviction_policy="least-recently-used")
+        self.threshold = threshold
+        self.dims = dims
+        self.namespace = namespace
+        self.max_per_group = max_per_group
+
+    def _hash(self, *parts: str) -> str:
+        return hashlib.sha256("\0".join((self.namespace, *parts)).encode("utf-8")).hexdigest()
+
+    def _key(self, prefix: str, job_text: str) -> str:
+        return "response:" + self._hash(prefix, " ".join(job_text.split()))
+
+    def _group_key(self, prefix: str, company: str, title: str) -> str:
+        return "group:" + self._hash(prefix, company.strip(), title.strip())
+
+    def get(self, prefix: str, job_text: str, company: str = "", title: str = "") -> Optional[str]:
+        """Return the cached response for this job text, or None.
+
+        Near-duplicate matching only runs when ``threshold`` is set and both
+        ``company`` and ``title`` are given.
+        """
+        response = self.cache.get(self._key(prefix, job_text))
+        if response is not None or self.threshold is None or not (company and title):
+            return response
+        entries: List[Tuple[np.ndarray, str]] = self.cache.get(self._group_key(prefix, company, title), [])
+        if not entries:
+            return None
+        scores = np.stack([vec for vec, _ in entries]) @ _embed(job_text, self.dims)
+        best = int(np.argmax(scores))
+        # The response itself may have been evicted since it was indexed
+        return self.cache.get(entries[best][1]) if scores[best] >= self.threshold else None
+
+    def put(self, prefix: str, job_text: str, response: str, company: str = "", title: str = "") -> None:
+        key = self._key(prefix, job_text)
+        self.cache.set(key, response)
+        if self.threshold is None or not (company and title):
+            return
+        group_key = self._group_key(prefix, company, title)
+        with self.cache.transact():
+            entries = [entry for entry in self.cache.get(group_key, []) if entry[1] != key]
+            entries.append((_embed(job_text, self.dims), key))
+            self.cache.set(group_key, entries[-self.max_per_group:])
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> Optional[SemanticLLMCache]:
+    """Shared response cache, or None when LLM_CACHE is disabled."""
+    if not cfg.enable_llm_cache:
+        return None
+    return SemanticLLMCache(
+        threshold=cfg.llm_cache_similarity,
+        namespace=f"{cfg.llm_mode}|{cfg.tailor_model_path}"
+    )
@@ -1,34 +1,110 @@
+import threading
+import time
 from dataclasses import dataclass
-from llama_cpp import Llama
+from functools import lru_cache
+from typing import Iterator, Optional
+from llama_cpp import Llama, LlamaDiskCache, LlamaRAMCache
 from config import cfg
+from utils.logger import get_logger
+
+logger = get_logger("llm")
+
+# Saved KV states for previously evaluated prompt prefixes (shared instructions + resume)
+PROMPT_STATE_CACHE_DIR = "output/.llm_cache/kv"
+PROMPT_STATE_CACHE_BYTES = 2 << 30
 
 @dataclass
 class LLM:
     def generate(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> str:
         raise NotImplementedError
 
+    def stream(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> Iterator[str]:
+        """Yield the completion in chunks; backends that can stream should override."""
+        yield self.generate(prompt, max_tokens=max_tokens, temperature=temperature)
+
 class LocalMistral(LLM):
-    def __init__(self):
+    def __init__(self, model_path: Optional[str] = None):
+        # A Llama context is not safe to use from several threads at once
+        self._lock = threading.Lock()
         self.llm = Llama(
-            model_path=cfg.llama_model_path,
+            model_path=model_path or cfg.llama_model_path,
             n_ctx=cfg.llama_ctx,
             n_threads=cfg.llama_n_threads,
             n_gpu_layers=cfg.llama_n_gpu_layers,
             verbose=False
         )
+        # llama-cpp restores the longest cached prefix before evaluating a
+        # prompt, so the instructions + resume block is only prefilled once
+        # ("disk" also across runs). Off by default: every completion saves
+        # the full KV state, which is hundreds of MB at a 4096 context.
+        if cfg.llm_prompt_cache == "disk":
+            self.llm.set_cache(LlamaDiskCache(PROMPT_STATE_CACHE_DIR, PROMPT_STATE_CACHE_BYTES))
+        elif cfg.llm_prompt_cache == "ram":
+            self.llm.set_cache(LlamaRAMCache(PROMPT_STATE_CACHE_BYTES))
+        elif cfg.llm_prompt_cache != "off":
+            logger.warning(f"Unknown LLM_PROMPT_CACHE={cfg.llm_prompt_cache!r}; prompt state cache disabled")
 
-    def generate(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> str:
+    @staticmethod
+    def _instruct(prompt: str) -> str:
         # Simple instruct format without duplicate BOS token
         if prompt.lstrip().startswith("<s>"):
             prompt = prompt.lstrip()[3:].lstrip()
-        full = f"[INST] {prompt} [/INST]"
-        out = self.llm(
-            full,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            stop=["</s>", "[INST]"]
+        return f"[INST] {prompt} [/INST]"
+
+    def generate(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> str:
+        full = self._instruct(prompt)
+        with self._lock:
+            started = time.perf_counter()
+            out = self.llm(
+                full,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop=["</s>", "[INST]"]
+            )
+            elapsed = time.perf_counter() - started
+        usage = out.get("usage") or {}
+        completion_tokens = usage.get("completion_tokens", 0)
+        logger.debug(
+            f"LLM generate: prompt={usage.get('prompt_tokens', 0)} tok, "
+            f"completion={completion_tokens} tok, {elapsed:.1f}s "
+            f"({completion_tokens / elapsed if elapsed else 0:.1f} tok/s)"
         )
         return out["choices"][0]["text"].strip()
 
-def get_local_llm() -> LLM:
-    return LocalMistral()
+    def stream(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> Iterator[str]:
+        """Yield completion text as it is decoded.
+
+        The model stays locked until the generator is exhausted or closed;
+        closing it early stops decoding.
+        """
+        full = self._instruct(prompt)
+        with self._lock:
+            started = time.perf_counter()
+            chunks = 0
+            completion = self.llm(
+                full,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop=["</s>", "[INST]"],
+                stream=True
+            )
+            try:
+                for out in completion:
+                    chunks += 1
+                    yield out["choices"][0]["text"]
+            finally:
+                completion.close()
+                elapsed = time.perf_counter() - started
+                logger.debug(
+                    f"LLM stream: {chunks} tok, {elapsed:.1f}s "
+                    f"({chunks / elapsed if elapsed else 0:.1f} tok/s)"
+                )
+
+@lru_cache(maxsize=2)
+def _load_local_llm(model_path: str) -> LLM:
+    # Loading the weights takes seconds; keep one instance per model file
+    return LocalMistral(model_path)
+
+def get_local_llm(model_path: Optional[str] = None) -> LLM:
+    """Return the shared local model, defaulting to LLAMA_MODEL_PATH."""
+    return _load_local_llm(model_path or cfg.llama_model_path)
@@ -1,5 +1,11 @@
 
+from typing import Iterator
+
 class MockLLM:
+    def stream(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> Iterator[str]:
+        # Line by line, so streaming consumers see section boundaries arrive
+        yield from self.generate(prompt, max_tokens=max_tokens, temperature=temperature).splitlines(keepends=True)
+
     def generate(self, prompt: str, max_tokens: int = 768, temperature: float = 0.6) -> str:
         """Mock LLM that returns a simple response for testing."""
         return """## SUMMARY
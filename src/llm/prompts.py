@@ -1,18 +1,12 @@
-TAILOR_PROMPT = """
+# Layout note: everything that is identical across jobs (instructions, then
+# the candidate's resume) comes first and the per-job fields come last, so
+# backends that reuse a cached prompt prefix only pay prefill for the job.
+# The prefix is formatted once per profile and the short job suffix per job.
+TAILOR_PROMPT_PREFIX = """
 You are an expert resume writer and career coach. Your task is to tailor the provided resume to a specific job description. You must only use the information available in the original resume.
 
 **CRITICAL RULE: Do not invent, add, or exaggerate any skills, experiences, or qualifications that are not explicitly mentioned in the original resume. Your goal is to rephrase, reframe, and highlight the existing information to align with the job description.**
 
-**Resume Content:**
----
-{resume_text}
----
-
-**Job Description:**
----
-{job_text}
----
-
 **Instructions:**
 
 1.  **Analyze the Job Description:** Carefully read the job description to identify the key requirements, skills, and qualifications the employer is looking for.
@@ -31,40 +25,40 @@ You are an expert resume writer and career coach. Your task is to tailor the pro
 
 **Output Format:**
 
-Provide the tailored content in the following format, with each section clearly marked.
-
-SUMMARY:
-<Your rewritten summary here>
-
-EXPERIENCE:
-<Your rewritten experience section here, with each job and its bullet points>
-
-PROJECTS:
-<Your rewritten projects section here>
+Respond with a single JSON object and nothing else (no markdown fences, no commentary), using exactly these keys:
 
-SKILLS:
-<Your rewritten skills section here>
+{{
+  "summary": "<your rewritten summary>",
+  "experience": [
+    {{"title": "...", "company": "...", "location": "...", "dates": "...", "bullets": ["...", "..."]}}
+  ],
+  "projects": [
+    {{"name": "...", "description": "...", "technologies": ["..."], "achievements": ["..."]}}
+  ],
+  "skills": {{"<category>": ["<skill>", "..."]}}
+}}
 
+**Resume Content:**
+---
+{resume_text}
+---
 """
 
-COVER_LETTER_PROMPT = """Write a highly personalized cover letter (250-350 words) for the specific job and company below. Research the company's mission, values, and recent developments to create a compelling narrative that shows genuine interest and perfect fit.
-
-JOB:
+TAILOR_PROMPT_JOB_SUFFIX = """
+**Job Description:**
 Title: {job_title}
 Company: {company}
 Location: {location}
 URL: {job_url}
+---
+{job_text}
+---
+"""
 
-CANDIDATE:
-Name: {name}
-Email: {email}
-Phone: {phone}
-
-BASE_COVER_LETTER (optional):
-{base_text}
+TAILOR_PROMPT = TAILOR_PROMPT_PREFIX + TAILOR_PROMPT_JOB_SUFFIX
 
-JOB DESCRIPTION (raw text):
-{job_text}
+# Same layout as TAILOR_PROMPT: instructions and candidate data first, job last.
+COVER_LETTER_PROMPT = """Write a highly personalized cover letter (250-350 words) for the specific job and company below. Research the company's mission, values, and recent developments to create a compelling narrative that shows genuine interest and perfect fit.
 
 REQUIREMENTS:
 1) Opening paragraph: Hook with specific company knowledge and role interest
@@ -74,4 +68,21 @@ REQUIREMENTS:
 
 Use the candidate's authentic voice while demonstrating deep understanding of both the role requirements and company culture. Include specific examples and quantified achievements where possible.
 
-OUTPUT: Professional cover letter body text (no greeting or signature lines)."""
+OUTPUT: Professional cover letter body text (no greeting or signature lines).
+
+CANDIDATE:
+Name: {name}
+Email: {email}
+Phone: {phone}
+
+BASE_COVER_LETTER (optional):
+{base_text}
+
+--- JOB ---
+Title: {job_title}
+Company: {company}
+Location: {location}
+URL: {job_url}
+
+JOB DESCRIPTION (raw text):
+{job_text}"""
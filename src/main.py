@@ -1,14 +1,15 @@
 import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Iterable
 from config import cfg
 from preferences import get_preferences
 from utils.logger import get_logger
 from storage.db import upsert_job, is_applied
 from parsers.resume_parser import parse_resume
-from generators.services.resume_tailor import ResumeTailor
+from generators.services.resume_tailor import ResumeTailor, create_docx_pool
 from generators.services.cover_letter_service import CoverLetterService
 from generators.services.fallback_service import FallbackService
-from apply.applicant import apply
+from apply.applicant import apply, LinkedInApplySession
 from storage.models import JobPost
 
 from providers import indeed as indeed_p
@@ -18,6 +19,9 @@ from providers import linkedin as linkedin_p
 
 logger = get_logger("main")
 
+# Jobs tailored per LLM batch call
+TAILOR_BATCH_SIZE = 8
+
 def _safe_part(s: str, limit: int = 12) -> str:
     part = ''.join(ch for ch in s if ch.isalnum() or ch in ('-', '_', ' ')).strip().replace(' ', '-')
     return part[:limit] if part else 'x'
@@ -53,6 +57,18 @@ def gather_jobs() -> list[JobPost]:
     return results
 
 def process_jobs(jobs: Iterable[JobPost], profile):
+    # One browser session is shared by every LinkedIn application in the batch,
+    # and one process pool by every resume build
+    with LinkedInApplySession() as session, create_docx_pool() as docx_pool:
+        _process_jobs(jobs, profile, session, docx_pool)
+
+def _process_jobs(
+    jobs: Iterable[JobPost],
+    profile,
+    session: LinkedInApplySession,
+    docx_pool: ProcessPoolExecutor,
+):
+    pending: list[JobPost] = []
     processed: set[str] = set()
     for job in jobs:
         if job.job_id in processed:
@@ -60,54 +76,93 @@ def process_jobs(jobs: Iterable[JobPost], profile):
         processed.add(job.job_id)
         if is_applied(job.job_id):
             continue
-        # Make slug more unique and safe
-        job_slug = f"{job.source}_{_safe_part(job.company, 10)}_{_safe_part(job.title, 14)}_{job.job_id[:8]}"
+        pending.append(job)
+    
+    # Check if tailoring is enabled
+    if not cfg.enable_tailoring:
+        if pending:
+            logger.info("Tailoring is disabled. Skipping resume and cover letter generation.")
+        return
+    
+    # Tailor in batches; each resume document is built in parallel as soon as
+    # its LLM response is in. Cover letters need no LLM, so they are built on a
+    # worker pool while the batch is being tailored.
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        for start in range(0, len(pending), TAILOR_BATCH_SIZE):
+            batch = pending[start:start + TAILOR_BATCH_SIZE]
+            outputs = [_output_paths(job) for job in batch]
+            cover_letters = [
+                pool.submit(CoverLetterService(profile, job).generate_cover_letter, cl_out)
+                for job, (_, cl_out) in zip(batch, outputs)
+            ]
+            # tailor_many reports per-job failures as None and only returns once
+            # every resume build it started has finished, so the fallback in
+            # _process_job never writes a path a worker is still writing
+            try:
+                written = ResumeTailor(profile, batch[0]).tailor_many(
+                    batch, [resume_out for resume_out, _ in outputs], docx_pool
+                )
+            except Exception as e:
+                logger.error(f"Batch tailoring failed: {e}")
+                written = [None] * len(batch)
+            for job, (resume_out, cl_out), resume_written, cover_letter in zip(batch, outputs, written, cover_letters):
+                _process_job(job, profile, resume_out, cl_out, resume_written is not None, cover_letter, session)
+
+def _output_paths(job: JobPost) -> tuple[str, str]:
+    # Make slug more unique and safe
+    job_slug = f"{job.source}_{_safe_part(job.company, 10)}_{_safe_part(job.title, 14)}_{job.job_id[:8]}"
+    
+    # Create output directory if it doesn't exist
+    output_dir = os.path.join('output', 'tailored', job_slug)
+    os.makedirs(output_dir, exist_ok=True)
+        
+    # Generate resume and cover letter
+    resume_out = os.path.join(output_dir, f'resume_{job_slug}.docx')
+    cl_out = os.path.join(output_dir, f'cover_letter_{job_slug}.docx')
+    return resume_out, cl_out
+
+def _process_job(
+    job: JobPost,
+    profile,
+    resume_out: str,
+    cl_out: str,
+    resume_ready: bool,
+    cover_letter: Future,
+    session: LinkedInApplySession,
+):
+    try:
+        if not resume_ready:
+            raise RuntimeError("no tailored resume generated")
         
-        # Create output directory if it doesn't exist
-        output_dir = os.path.join('output', 'tailored', job_slug)
-        os.makedirs(output_dir, exist_ok=True)
+        # Wait for the cover letter; re-raises if building it failed
+        cover_letter.result()
         
-        # Check if tailoring is enabled
-        if not cfg.enable_tailoring:
-            logger.info("Tailoring is disabled. Skipping resume and cover letter generation.")
-            return
-            
-        # Generate resume and cover letter
-        resume_out = os.path.join(output_dir, f'resume_{job_slug}.docx')
-        cl_out = os.path.join(output_dir, f'cover_letter_{job_slug}.docx')
+        logger.info(f"Tailored docs: {resume_out}, {cl_out}")
         
+        # Attempt application (only if provider supports it here)
+        applied = apply(job, resume_out, cl_out, session=session)
+        logger.info(f"Applied={applied} to {job.title} @ {job.company} ({job.source}) -> {job.url}")
+        
+    except Exception as e:
+        logger.error(f"Error processing job {job.job_id}: {e}")
+        # Try fallback mechanism if available
         try:
-            # Create resume
-            resume_tailor = ResumeTailor(profile, job)
-            # Generate tailored content first
-            tailored_data = resume_tailor.generate_tailored_content()
-            # Create the resume with tailored content
-            resume_tailor.create_tailored_resume(tailored_data, resume_out) 
-            
-            # Create cover letter
-            cl_service = CoverLetterService(profile, job)
-            cl_service.generate_cover_letter(cl_out)
-            
-            logger.info(f"Tailored docs: {resume_out}, {cl_out}")
-            
-            # Attempt application (only if provider supports it here)
-            applied = apply(job, resume_out, cl_out)
-            logger.info(f"Applied={applied} to {job.title} @ {job.company} ({job.source}) -> {job.url}")
-            
-        except Exception as e:
-            logger.error(f"Error processing job {job.job_id}: {e}")
-            # Try fallback mechanism if available
-            try:
-                fallback = FallbackService(profile, job)
-                fallback.create_basic_resume(resume_out)
-                logger.warning(f"Used fallback resume for {job.job_id}")
-                applied = apply(job, resume_out, None)
-                logger.info(f"Applied with fallback={applied} to {job.title} @ {job.company}")
-            except Exception as fallback_error:
-                logger.error(f"Fallback also failed for {job.job_id}: {fallback_error}")
+            fallback = FallbackService(profile, job)
+            fallback.create_basic_resume(resume_out)
+            logger.warning(f"Used fallback resume for {job.job_id}")
+            applied = apply(job, resume_out, None, session=session)
+            logger.info(f"Applied with fallback={applied} to {job.title} @ {job.company}")
+        except Exception as fallback_error:
+            logger.error(f"Fallback also failed for {job.job_id}: {fallback_error}")
 
 def main():
     profile = parse_resume(cfg.resume_path)
+    if cfg.enable_tailoring:
+        try:
+            ResumeTailor.preload()
+        except Exception as e:
+            # Tailoring loads the model on demand and reports per-job failures
+            logger.warning(f"LLM preload failed, continuing without it: {e}")
     logger.info(f"Parsed resume: name={profile.name} email={profile.email}")
     jobs = gather_jobs()
     # Filter for India / Remote globally is already handled by providers' location check
@@ -45,6 +45,46 @@ class ResumeProfile:
     research_publications: List[ResearchPublication]
     raw_text: str
 
+# Patterns used by the section parsers, compiled once at import
+_EMAIL = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+_PHONE = re.compile(r"(?:\+?\d[\s-]?){8,15}")
+_LINKEDIN = re.compile(r"linkedin\.com/in/[A-Za-z0-9-_]+", re.IGNORECASE)
+_GITHUB = re.compile(r"github\.com/[A-Za-z0-9-_]+", re.IGNORECASE)
+
+_EXPERIENCE_SECTION = re.compile(
+    r"(?:EXPERIENCE|WORK EXPERIENCE|EMPLOYMENT)(.*?)(?=\n(?:EDUCATION|SKILLS|PROJECTS|KEY PROJECTS|RESEARCH|$))",
+    re.IGNORECASE | re.DOTALL
+)
+_JOB_ENTRY_SPLIT = re.compile(r"\n(?=[A-Z][^\n]*(?:\||–|-).*?(?:20\d{2}|\d{4}))")
+_JOB_DATE_RANGE = re.compile(r"(\w+\s+20\d{2}\s*-\s*\w+\s+20\d{2}|\w+\s+20\d{2}\s*-\s*Present)")
+_JOB_HEADER_LINE = re.compile(r"^[A-Z][^\n]*(?:\||–|-)")
+
+_PROJECTS_SECTION = re.compile(
+    r"(?:KEY PROJECTS|PROJECTS)(.*?)(?=\n(?:EXPERIENCE|EDUCATION|SKILLS|RESEARCH|$))",
+    re.IGNORECASE | re.DOTALL
+)
+_PROJECT_ENTRY_SPLIT = re.compile(r"\n(?=[A-Z][^\n]*(?:–|-|:))")
+_PROJECT_TECH = re.compile(
+    r"\b(?:Python|PyTorch|TensorFlow|JavaScript|React|Node|AWS|Docker|MongoDB|SQL|FastAPI|Streamlit)\b",
+    re.IGNORECASE
+)
+
+_SKILLS_SECTION = re.compile(r"(?:SKILLS|TECHNICAL SKILLS)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))", re.IGNORECASE | re.DOTALL)
+_SKILL_SPLIT = re.compile(r"[|,]")
+_EDUCATION_SECTION = re.compile(
+    r"(?:EDUCATION|EDUCATION AND CERTIFICATIONS)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))",
+    re.IGNORECASE | re.DOTALL
+)
+_RESEARCH_SECTION = re.compile(
+    r"(?:RESEARCH|PUBLICATIONS|RESEARCH PUBLICATIONS)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))",
+    re.IGNORECASE | re.DOTALL
+)
+_PARENTHESIZED = re.compile(r"\(([^)]+)\)")
+_SUMMARY_SECTION = re.compile(
+    r"(?:SUMMARY|PROFILE|OBJECTIVE)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))",
+    re.IGNORECASE | re.DOTALL
+)
+
 def _extract_text(path: str) -> str:
     """Extract text from PDF, DOCX, or TXT files."""
     if path.lower().endswith(".pdf"):
@@ -61,22 +101,22 @@ def _extract_contact_info(text: str) -> Dict[str, Optional[str]]:
     contact = {"email": None, "phone": None, "linkedin": None, "github": None, "name": None}
 
     # Email extraction (stricter pattern)
-    email_match = re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", text)
+    email_match = _EMAIL.search(text)
     if email_match:
         contact["email"] = email_match.group(0).strip()
 
     # Phone extraction
-    phone_match = re.search(r"(?:\+?\d[\s-]?){8,15}", text)
+    phone_match = _PHONE.search(text)
     if phone_match:
         contact["phone"] = phone_match.group(0).strip()
 
     # LinkedIn extraction  
-    linkedin_match = re.search(r"linkedin\.com/in/[A-Za-z0-9-_]+", text, re.IGNORECASE)
+    linkedin_match = _LINKEDIN.search(text)
     if linkedin_match:
         contact["linkedin"] = linkedin_match.group(0)
 
     # GitHub extraction
-    github_match = re.search(r"github\.com/[A-Za-z0-9-_]+", text, re.IGNORECASE)
+    github_match = _GITHUB.search(text)
     if github_match:
         contact["github"] = github_match.group(0)
 
@@ -97,8 +137,7 @@ def _parse_experience_section(text: str) -> List[Experience]:
     experiences = []
 
     # Find experience section
-    exp_pattern = r"(?:EXPERIENCE|WORK EXPERIENCE|EMPLOYMENT)(.*?)(?=\n(?:EDUCATION|SKILLS|PROJECTS|KEY PROJECTS|RESEARCH|$))"
-    exp_match = re.search(exp_pattern, text, re.IGNORECASE | re.DOTALL)
+    exp_match = _EXPERIENCE_SECTION.search(text)
 
     if not exp_match:
         return experiences
@@ -106,7 +145,7 @@ def _parse_experience_section(text: str) -> List[Experience]:
     exp_text = exp_match.group(1).strip()
 
     # Split by job entries (look for patterns like "Job Title | Company" or "Company")
-    job_entries = re.split(r"\n(?=[A-Z][^\n]*(?:\||–|-).*?(?:20\d{2}|\d{4}))", exp_text)
+    job_entries = _JOB_ENTRY_SPLIT.split(exp_text)
 
     for entry in job_entries:
         if not entry.strip():
@@ -127,7 +166,7 @@ def _parse_experience_section(text: str) -> List[Experience]:
                 title = parts[0]
                 company_date = parts[1]
                 # Extract company and date
-                date_match = re.search(r"(\w+\s+20\d{2}\s*-\s*\w+\s+20\d{2}|\w+\s+20\d{2}\s*-\s*Present)", company_date)
+                date_match = _JOB_DATE_RANGE.search(company_date)
                 if date_match:
                     duration = date_match.group(1)
                     company = company_date.replace(duration, "").strip()
@@ -137,7 +176,7 @@ def _parse_experience_section(text: str) -> List[Experience]:
         # Parse bullet points
         description = []
         for line in lines[1:]:
-            if line and not re.match(r"^[A-Z][^\n]*(?:\||–|-)", line):  # Not a new job header
+            if line and not _JOB_HEADER_LINE.match(line):  # Not a new job header
                 description.append(line.strip("• -"))
 
         if title or company:  # Only add if we found something meaningful
@@ -155,8 +194,7 @@ def _parse_projects_section(text: str) -> List[Project]:
     projects = []
 
     # Find projects section
-    proj_pattern = r"(?:KEY PROJECTS|PROJECTS)(.*?)(?=\n(?:EXPERIENCE|EDUCATION|SKILLS|RESEARCH|$))"
-    proj_match = re.search(proj_pattern, text, re.IGNORECASE | re.DOTALL)
+    proj_match = _PROJECTS_SECTION.search(text)
 
     if not proj_match:
         return projects
@@ -164,7 +202,7 @@ def _parse_projects_section(text: str) -> List[Project]:
     proj_text = proj_match.group(1).strip()
 
     # Split by project names (usually standalone lines)
-    project_entries = re.split(r"\n(?=[A-Z][^\n]*(?:–|-|:))", proj_text)
+    project_entries = _PROJECT_ENTRY_SPLIT.split(proj_text)
 
     for entry in project_entries:
         if not entry.strip():
@@ -186,7 +224,7 @@ def _parse_projects_section(text: str) -> List[Project]:
             description.append(clean_line)
 
             # Extract technologies (look for parentheses or common tech terms)
-            tech_match = re.findall(r"\b(?:Python|PyTorch|TensorFlow|JavaScript|React|Node|AWS|Docker|MongoDB|SQL|FastAPI|Streamlit)\b", clean_line, re.IGNORECASE)
+            tech_match = _PROJECT_TECH.findall(clean_line)
             technologies.extend(tech_match)
 
         projects.append(Project(
@@ -202,8 +240,7 @@ def _parse_skills_section(text: str) -> Dict[str, List[str]]:
     skills = {}
 
     # Find skills section
-    skills_pattern = r"(?:SKILLS|TECHNICAL SKILLS)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))"
-    skills_match = re.search(skills_pattern, text, re.IGNORECASE | re.DOTALL)
+    skills_match = _SKILLS_SECTION.search(text)
 
     if not skills_match:
         return skills
@@ -223,16 +260,16 @@ def _parse_skills_section(text: str) -> Dict[str, List[str]]:
                 parts = line.split(":", 1)
                 if len(parts) == 2:
                     category = parts[0].strip()
-                    skill_list = [s.strip() for s in re.split(r"[|,]", parts[1]) if s.strip()]
+                    skill_list = [s.strip() for s in _SKILL_SPLIT.split(parts[1]) if s.strip()]
                     skills[category] = skill_list
             else:
                 # Treat as single category
-                skill_list = [s.strip() for s in re.split(r"[|,]", line) if s.strip()]
+                skill_list = [s.strip() for s in _SKILL_SPLIT.split(line) if s.strip()]
                 if skill_list:
                     skills["Technical Skills"] = skill_list
         else:
             # Single line of skills
-            skill_list = [s.strip() for s in re.split(r"[|,]", line) if s.strip()]
+            skill_list = [s.strip() for s in _SKILL_SPLIT.split(line) if s.strip()]
             if skill_list:
                 skills["Technical Skills"] = skills.get("Technical Skills", []) + skill_list
 
@@ -243,8 +280,7 @@ def _parse_education_section(text: str) -> List[Education]:
     education = []
 
     # Find education section  
-    edu_pattern = r"(?:EDUCATION|EDUCATION AND CERTIFICATIONS)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))"
-    edu_match = re.search(edu_pattern, text, re.IGNORECASE | re.DOTALL)
+    edu_match = _EDUCATION_SECTION.search(text)
 
     if not edu_match:
         return education
@@ -269,8 +305,7 @@ def _parse_research_section(text: str) -> List[ResearchPublication]:
     publications = []
 
     # Find research section
-    research_pattern = r"(?:RESEARCH|PUBLICATIONS|RESEARCH PUBLICATIONS)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))"
-    research_match = re.search(research_pattern, text, re.IGNORECASE | re.DOTALL)
+    research_match = _RESEARCH_SECTION.search(text)
 
     if not research_match:
         return publications
@@ -280,9 +315,9 @@ def _parse_research_section(text: str) -> List[ResearchPublication]:
 
     for line in lines:
         # Extract publication title and link
-        link_match = re.search(r"\(([^)]+)\)", line)
+        link_match = _PARENTHESIZED.search(line)
         link = link_match.group(1) if link_match else None
-        title = re.sub(r"\([^)]+\)", "", line).strip("• -")
+        title = _PARENTHESIZED.sub("", line).strip("• -")
 
         if title:
             publications.append(ResearchPublication(
@@ -302,7 +337,7 @@ def parse_resume(path: str) -> ResumeProfile:
 
     # Extract summary (first few sentences after name/contact)
     summary = None
-    summary_match = re.search(r"(?:SUMMARY|PROFILE|OBJECTIVE)(.*?)(?=\n(?:[A-Z][A-Z\s]+|$))", text, re.IGNORECASE | re.DOTALL)
+    summary_match = _SUMMARY_SECTION.search(text)
     if summary_match:
         summary = summary_match.group(1).strip()
 
@@ -12,9 +12,9 @@ class Preferences:
 
 def get_preferences() -> Preferences:
     return Preferences(
-        keywords=cfg.keywords,
-        cities=cfg.cities,
-        countries=cfg.countries,
+        keywords=list(cfg.keywords),
+        cities=list(cfg.cities),
+        countries=list(cfg.countries),
         remote_ok=cfg.remote_ok,
         remote_global_ok=cfg.remote_global_ok,
     )
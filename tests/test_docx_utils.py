@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+# Add src directory to Python path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from docx import Document
+
+from generators.utils.docx_utils import append_body_xml, xml_attr, xml_run_content
+
+
+def test_raw_run_matches_run_text():
+    """Raw run markup keeps tabs, line breaks and markup characters like run.text does."""
+    text = 'Led "X" <team> & shipped\tQ3\nfollow-up\r'
+    doc = Document()
+    reference = doc.add_paragraph()
+    reference.add_run().text = text
+
+    append_body_xml(doc, f"<w:p><w:r>{xml_run_content(text)}</w:r></w:p>")
+
+    assert doc.paragraphs[-1].text == reference.text
+
+
+def test_xml_attr_escapes_quotes():
+    style_id = 'a"b<c'
+    doc = Document()
+    append_body_xml(doc, f'<w:p><w:pPr><w:pStyle w:val="{xml_attr(style_id)}"/></w:pPr></w:p>')
+
+    assert doc.paragraphs[-1]._p.style == style_id
+
+
+if __name__ == "__main__":
+    test_raw_run_matches_run_text()
+    test_xml_attr_escapes_quotes()
+    print("docx_utils tests passed")
@@ -0,0 +1,58 @@
+import json
+import sys
+from pathlib import Path
+
+# Add src directory to Python path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from llm.mock_llm import MockLLM
+from generators.utils.parsing_utils import StreamingResponseParser, parse_llm_response
+
+
+def test_parse_mock_llm_response():
+    """The MockLLM response parses into every section, including research publications."""
+    tailored = parse_llm_response(MockLLM().generate("prompt"))
+
+    assert tailored.summary.startswith("Experienced Software Engineer")
+    assert tailored.experience
+    assert tailored.projects
+    assert tailored.education
+    assert [pub.title for pub in tailored.research_publications] == [
+        "Optimizing Web Applications for Performance"
+    ]
+
+
+def test_stream_mock_llm_response():
+    """Streaming the MockLLM response gives the same result as parsing it whole."""
+    llm = MockLLM()
+    parser = StreamingResponseParser()
+    for chunk in llm.stream("prompt"):
+        if parser.feed(chunk):
+            break
+
+    assert parser.finish() == parse_llm_response(llm.generate("prompt"))
+
+
+def test_truncated_json_response():
+    """A JSON answer cut off by the token limit keeps its complete values and no JSON text."""
+    response = json.dumps({
+        "summary": "Tailored summary",
+        "experience": [{"title": "Engineer", "company": "Acme", "bullets": ["Shipped things"]}],
+    }, indent=2)
+    truncated = response[:response.index("Shipped") + 4]
+
+    tailored = parse_llm_response(truncated)
+
+    assert tailored.summary == "Tailored summary"
+    assert tailored.experience[0]["title"] == "Engineer"
+    parser = StreamingResponseParser()
+    parser.feed(truncated)
+    assert parser.finish() == tailored
+
+
+if __name__ == "__main__":
+    test_parse_mock_llm_response()
+    test_stream_mock_llm_response()
+    test_truncated_json_response()
+    print("Parsing tests passed")
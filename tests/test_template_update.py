@@ -0,0 +1,103 @@
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add src directory to Python path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from docx import Document
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+from generators.models.tailored_data import TailoredResumeData
+from generators.services.resume_tailor import ResumeTailor
+
+TEMPLATE_PATH = ROOT / "data" / "resume.docx"
+
+SECTION_HEADINGS = [
+    "SUMMARY",
+    "KEY PROJECTS",
+    "EXPERIENCE",
+    "SKILLS",
+    "EDUCATION AND CERTIFICATIONS",
+    "RESEARCH PUBLICATIONS",
+]
+
+
+class _Profile:
+    name = "Test Candidate"
+    raw_text = ""
+
+
+class _Job:
+    title = "Machine Learning Engineer"
+    company = "Example Corp"
+    location = "Remote"
+    url = "https://example.com/job/1"
+    description = ""
+    job_id = "test-job"
+
+
+def _sections(doc):
+    """Map each Heading 1 text to the text of every block up to the next Heading 1 / Title."""
+    sections = {}
+    current = None
+    for child in doc.element.body.iterchildren(qn("w:p"), qn("w:tbl")):
+        if child.tag == qn("w:p"):
+            para = Paragraph(child, doc._body)
+            if para.style.name in ("Heading 1", "Title"):
+                current = para.text.strip()
+                assert current not in sections, f"Duplicate section {current!r}"
+                sections[current] = []
+                continue
+        if current is not None:
+            sections[current].append("".join(child.itertext(qn("w:t"))).strip())
+    return sections
+
+
+def _build_from_template():
+    data = TailoredResumeData(
+        summary="Tailored summary",
+        experience=[{"title": "Engineer", "company": "Acme", "bullets": ["Shipped things"]}],
+        projects=[{"name": "Proj", "technologies": ["Python"], "description": "Built it"}],
+        technical_skills={"Languages": ["Python", "Go"]},
+        education=[{"degree": "BS", "school": "University", "date": "2020"}],
+        research_publications=["Paper A"],
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "tailored.docx")
+        result = ResumeTailor(_Profile(), _Job()).create_tailored_resume(
+            data, output_path, str(TEMPLATE_PATH)
+        )
+        assert result == output_path
+        return Document(output_path)
+
+
+def test_template_sections_survive_update():
+    """Every template section heading is kept, once, in its original order."""
+    doc = _build_from_template()
+    assert [name for name in _sections(doc) if name in SECTION_HEADINGS] == SECTION_HEADINGS
+    assert list(_sections(doc))[1:] == SECTION_HEADINGS
+
+
+def test_template_sections_hold_new_content():
+    """Each section's tailored content sits between its heading and the next one."""
+    sections = _sections(_build_from_template())
+    expected = {
+        "SUMMARY": ["Tailored summary"],
+        "KEY PROJECTS": ["Proj | Technologies: Python", "Built it"],
+        "EXPERIENCE": ["Engineer • Acme", "Shipped things"],
+        "SKILLS": ["LANGUAGES", "Python, Go"],
+        "EDUCATION AND CERTIFICATIONS": ["BS, University2020"],
+        "RESEARCH PUBLICATIONS": ["Paper A"],
+    }
+    for heading, content in expected.items():
+        assert [text for text in sections[heading] if text] == content, heading
+
+
+if __name__ == "__main__":
+    test_template_sections_survive_update()
+    test_template_sections_hold_new_content()
+    print("Template update test passed")